@@ -1592,6 +1592,27 @@ class TestEngine:
         result["token_usage"] = token_usage
         return result
 
+    @staticmethod
+    def _case_from_result(result: Dict, default_icon: str) -> Dict:
+        """从测试结果还原测试案例（用于重试）"""
+        return {
+            "id": result["id"],
+            "name": result["name"],
+            "category": result.get("category", "未分类"),
+            "difficulty": result.get("difficulty", "中"),
+            "tags": result.get("tags", []),
+            "icon": result.get("icon", default_icon),
+            "prompt": result["prompt"]
+        }
+
+    @staticmethod
+    def _index_by_id(results: List[Dict]) -> Dict:
+        """id -> 该 id 第一次出现的下标（id 重复时与逐个查找第一个匹配的行为一致）"""
+        index = {}
+        for i, r in enumerate(results):
+            index.setdefault(r["id"], i)
+        return index
+
     def retry_failed_tests(self, test_type="all"):
         """
         重试失败的测试案例
@@ -1605,21 +1626,13 @@ class TestEngine:
             failed_text = [r for r in self.results.get("text", []) if not r.get("success", True)]
             if failed_text:
                 self.log(f"🔄 重试 {len(failed_text)} 个失败的代码生成案例...")
+                text_idx = self._index_by_id(self.results["text"])
                 for result in failed_text:
-                    case = {
-                        "id": result["id"],
-                        "name": result["name"],
-                        "category": result.get("category", "未分类"),
-                        "difficulty": result.get("difficulty", "中"),
-                        "tags": result.get("tags", []),
-                        "icon": result.get("icon", "📄"),
-                        "prompt": result["prompt"]
-                    }
+                    case = self._case_from_result(result, "📄")
                     try:
                         new_result = self.run_single_text_test(case)
                         # 更新结果
-                        idx = next(i for i, r in enumerate(self.results["text"]) if r["id"] == case["id"])
-                        self.results["text"][idx] = new_result
+                        self.results["text"][text_idx[case["id"]]] = new_result
                         self.log(f"✅ [重试成功] {case['id']} {case['name']}")
                         retry_count += 1
                     except Exception as e:
@@ -1629,20 +1642,12 @@ class TestEngine:
             failed_image = [r for r in self.results.get("image", []) if not r.get("success", True)]
             if failed_image:
                 self.log(f"🔄 重试 {len(failed_image)} 个失败的文生图案例...")
+                image_idx = self._index_by_id(self.results["image"])
                 for result in failed_image:
-                    case = {
-                        "id": result["id"],
-                        "name": result["name"],
-                        "category": result.get("category", "未分类"),
-                        "difficulty": result.get("difficulty", "中"),
-                        "tags": result.get("tags", []),
-                        "icon": result.get("icon", "🖼️"),
-                        "prompt": result["prompt"]
-                    }
+                    case = self._case_from_result(result, "🖼️")
                     try:
                         new_result = self.run_single_image_test(case)
-                        idx = next(i for i, r in enumerate(self.results["image"]) if r["id"] == case["id"])
-                        self.results["image"][idx] = new_result
+                        self.results["image"][image_idx[case["id"]]] = new_result
                         self.log(f"✅ [重试成功] {case['id']} {case['name']}")
                         retry_count += 1
                     except Exception as e:
@@ -5,682 +5,558 @@
 """
 
 import json
+import os
+import gzip
+import hashlib
 from pathlib import Path
 from datetime import datetime
-
-
-class EnhancedWebsiteGenerator:
-    def __init__(self, output_dir, model_name="AI Model"):
-        self.output_dir = Path(output_dir)
-        self.model_name = model_name
-
-    def generate(self):
-        """生成展示网站"""
-        # 收集结果数据
-        text_results = self.collect_results("text")
-        writing_results = self.collect_results("writing")
-        image_results = self.collect_results("image")
-
-        # 加载统计数据
-        text_stats = self.load_stats("text")
-        writing_stats = self.load_stats("writing")
-        image_stats = self.load_stats("image")
-
-        # 生成精简数据文件
-        data = {
-            "meta": {
-                "model": self.model_name,
-                "generated_at": datetime.now().isoformat(),
-                "total_text": len(text_results),
-                "total_writing": len(writing_results),
-                "total_image": len(image_results)
-            },
-            "text_results": self.simplify_results(text_results),
-            "writing_results": self.simplify_results(writing_results),
-            "image_results": self.simplify_results(image_results),
-            "stats": {
-                "text": text_stats,
-                "writing": writing_stats,
-                "image": image_stats
-            }
-        }
-
-        data_path = self.output_dir / "website" / "data.json"
-        with open(data_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-
-        # 生成HTML
-        html_content = self.generate_html(data)
-        html_path = self.output_dir / "website" / "index.html"
-        with open(html_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
-
-        return html_path
-
-    def simplify_results(self, results):
-        """精简结果数据"""
-        simplified = []
-        for r in results:
-            simple_r = {
-                "id": r.get("id", ""),
-                "name": r.get("name", ""),
-                "category": r.get("category", "未分类"),
-                "difficulty": r.get("difficulty", "中"),
-                "tags": r.get("tags", []),
-                "icon": r.get("icon", "📄"),
-                "prompt": r.get("prompt", "")[:300],
-                "success": r.get("success", True),
-                "timestamp": r.get("timestamp", "")
-            }
-            if "html_file" in r:
-                simple_r["html_file"] = r["html_file"]
-            if "image_file" in r:
-                simple_r["image_file"] = r["image_file"]
-            if "txt_file" in r:
-                simple_r["txt_file"] = r["txt_file"]
-            if "response" in r:
-                # 截取响应内容用于预览
-                simple_r["response"] = r["response"][:500] if r.get("response") else ""
-            if "char_count" in r:
-                simple_r["char_count"] = r["char_count"]
-            simplified.append(simple_r)
-        return simplified
-
-    def load_stats(self, test_type):
-        """加载统计数据"""
-        stats_file = self.output_dir / test_type / "_stats.json"
-        if not stats_file.exists():
-            return {}
-        try:
-            with open(stats_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except:
-            return {}
-
-    def collect_results(self, test_type):
-        """收集测试结果（只收集成功的案例）"""
-        result_dir = self.output_dir / test_type
-        results = []
-        skipped = []
-
-        if not result_dir.exists():
-            return results
-
-        for json_file in result_dir.glob("*.json"):
-            # 跳过统计文件
-            if json_file.name.startswith("_"):
-                continue
-
-            try:
-                with open(json_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-
-                # 检查是否成功
-                if not data.get("success", True):
-                    skipped.append(data.get("id", json_file.stem))
-                    continue
-
-                base_name = json_file.stem
-
-                if test_type == "text":
-                    # 检查是否有HTML文件
-                    html_file = result_dir / f"{base_name}.html"
-                    if html_file.exists():
-                        data["html_file"] = f"../text/{html_file.name}"
-                    else:
-                        # 没有HTML文件，跳过
-                        skipped.append(data.get("id", base_name))
-                        continue
-                elif test_type == "writing":
-                    # 文生文测试，检查txt文件
-                    txt_file = result_dir / f"{base_name}.txt"
-                    if txt_file.exists():
-                        data["txt_file"] = f"../writing/{txt_file.name}"
-                    # 文生文不强制要求txt文件，因为response已经在json中
-                    results.append(data)
-                    continue
-                else:
-                    # 检查是否有图片文件
-                    found_image = False
-                    for ext in ["png", "jpg", "jpeg"]:
-                        img_file = result_dir / f"{base_name}.{ext}"
-                        if img_file.exists():
-                            data["image_file"] = f"../image/{img_file.name}"
-                            found_image = True
-                            break
-                    if not found_image:
-                        # 没有图片文件，跳过
-                        skipped.append(data.get("id", base_name))
-                        continue
-
-                results.append(data)
-            except Exception as e:
-                print(f"读取结果失败 {json_file}: {e}")
-
-        if skipped:
-            print(f"[{test_type}] 跳过 {len(skipped)} 个失败/无输出的案例: {', '.join(skipped)}")
-
-        return sorted(results, key=lambda x: x.get("id", ""))
-
-    def generate_html(self, data):
-        """生成增强版HTML页面"""
-        html = f'''<!DOCTYPE html>
+from string import Template
+from operator import itemgetter
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+# 页面样式完全静态，单独写成 website/style.css，由页面通过 <link> 引用
+_CSS_BYTES = ''':root {
+    --primary-color: #ff758c;
+    --secondary-color: #ff7eb3;
+    --accent-color: #726cf8;
+    --bg-light: #fdf2f8;
+    --bg-card: #ffffff;
+    --text-main: #374151;
+    --text-muted: #6b7280;
+    --gradient-brand: linear-gradient(135deg, #fce7f3 0%, #fbcfe8 100%);
+    --gradient-bg: linear-gradient(180deg, #fdf2f8 0%, #fce7f3 100%);
+    --glass-bg: rgba(255, 255, 255, 0.8);
+    --glass-border: rgba(255, 192, 203, 0.3);
+    --shadow-soft: 0 10px 30px -10px rgba(255, 117, 140, 0.2);
+}
+
+* {
+    box-sizing: border-box;
+    margin: 0;
+    padding: 0;
+}
+
+body {
+    font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
+    background: var(--gradient-bg);
+    color: var(--text-main);
+    line-height: 1.6;
+    overflow-x: hidden;
+    min-height: 100vh;
+}
+
+.container {
+    max-width: 1400px;
+    margin: 0 auto;
+    padding: 0 20px;
+}
+
+/* 头部设计 */
+header {
+    padding: 60px 0 40px;
+    text-align: center;
+    position: relative;
+}
+
+.brand-avatar {
+    width: 100px;
+    height: 100px;
+    border-radius: 50%;
+    margin: 0 auto 20px;
+    overflow: hidden;
+    box-shadow: 0 0 30px rgba(255, 117, 140, 0.3);
+    animation: float 6s ease-in-out infinite;
+}
+
+.brand-avatar img {
+    width: 100%;
+    height: 100%;
+    object-fit: cover;
+}
+
+@keyframes float {
+    0%, 100% { transform: translateY(0); }
+    50% { transform: translateY(-10px); }
+}
+
+h1 {
+    font-size: 2.5rem;
+    font-weight: 800;
+    margin-bottom: 10px;
+    background: linear-gradient(to right, #ec4899, #f472b6);
+    -webkit-background-clip: text;
+    -webkit-text-fill-color: transparent;
+    letter-spacing: -1px;
+}
+
+.subtitle {
+    font-size: 1.1rem;
+    color: var(--text-muted);
+    margin-bottom: 20px;
+    font-weight: 300;
+}
+
+/* 统计数据卡片 */
+.stats-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
+    gap: 20px;
+    margin-bottom: 40px;
+    max-width: 1000px;
+    margin-left: auto;
+    margin-right: auto;
+}
+
+.stat-card {
+    background: var(--bg-card);
+    backdrop-filter: blur(10px);
+    border: 1px solid var(--glass-border);
+    padding: 20px;
+    border-radius: 16px;
+    text-align: center;
+    transition: transform 0.3s ease;
+    box-shadow: 0 4px 15px rgba(0,0,0,0.05);
+}
+
+.stat-card:hover {
+    transform: translateY(-5px);
+    border-color: var(--primary-color);
+}
+
+.stat-value {
+    font-size: 1.8rem;
+    font-weight: 700;
+    color: var(--primary-color);
+    display: block;
+}
+
+.stat-label {
+    font-size: 0.85rem;
+    color: var(--text-muted);
+    text-transform: uppercase;
+    letter-spacing: 1px;
+}
+
+/* 搜索和筛选栏 */
+.filter-bar {
+    background: var(--bg-card);
+    border-radius: 16px;
+    padding: 20px;
+    margin-bottom: 30px;
+    box-shadow: 0 4px 15px rgba(0,0,0,0.05);
+    border: 1px solid var(--glass-border);
+}
+
+.search-box {
+    width: 100%;
+    padding: 12px 20px;
+    border: 2px solid var(--glass-border);
+    border-radius: 12px;
+    font-size: 1rem;
+    transition: all 0.3s ease;
+    margin-bottom: 15px;
+}
+
+.search-box:focus {
+    outline: none;
+    border-color: var(--primary-color);
+    box-shadow: 0 0 0 3px rgba(255, 117, 140, 0.1);
+}
+
+.filter-buttons {
+    display: flex;
+    flex-wrap: wrap;
+    gap: 10px;
+    margin-top: 10px;
+}
+
+.filter-btn {
+    padding: 8px 16px;
+    border: 2px solid var(--glass-border);
+    background: var(--bg-light);
+    border-radius: 8px;
+    cursor: pointer;
+    transition: all 0.3s ease;
+    font-size: 0.9rem;
+    font-weight: 500;
+}
+
+.filter-btn:hover {
+    border-color: var(--primary-color);
+    background: white;
+}
+
+.filter-btn.active {
+    background: linear-gradient(135deg, #ff758c 0%, #ff7eb3 100%);
+    color: white;
+    border-color: var(--primary-color);
+}
+
+/* 分类标题 */
+.section-title {
+    color: var(--text-main);
+    font-size: 1.8em;
+    margin: 50px 0 20px;
+    padding-left: 15px;
+    border-left: 4px solid var(--primary-color);
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+}
+
+.result-count {
+    font-size: 0.6em;
+    color: var(--text-muted);
+    font-weight: normal;
+}
+
+/* 画廊网格 */
+.gallery-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
+    gap: 24px;
+    padding-bottom: 50px;
+}
+
+.gallery-item {
+    position: relative;
+    border-radius: 16px;
+    overflow: hidden;
+    cursor: pointer;
+    background: var(--bg-card);
+    box-shadow: 0 4px 20px rgba(0,0,0,0.1);
+    transition: transform 0.4s cubic-bezier(0.165, 0.84, 0.44, 1);
+    /* 每张卡片独立布局与绘制，筛选时的重排不会波及整个网格；卡片本身已 overflow: hidden，裁剪不变 */
+    contain: layout paint style;
+}
+
+.hidden,
+.gallery-item.search-miss,
+.filter-diff-简单 .gallery-item:not(.diff-简单),
+.filter-diff-中 .gallery-item:not(.diff-中),
+.filter-diff-高 .gallery-item:not(.diff-高) {
+    display: none !important;
+}
+
+.gallery-item:hover {
+    transform: scale(1.02) translateY(-5px);
+    z-index: 2;
+    box-shadow: 0 15px 40px rgba(255, 117, 140, 0.3);
+}
+
+.gallery-img {
+    width: 100%;
+    height: 250px;
+    object-fit: cover;
+    transition: transform 0.5s ease;
+}
+
+.gallery-item:hover .gallery-img {
+    transform: scale(1.1);
+}
+
+/* 图标背景 */
+.icon-bg {
+    width: 100%;
+    height: 220px;
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    background: var(--gradient-brand);
+    position: relative;
+    overflow: hidden;
+}
+
+.icon-bg::before {
+    content: '';
+    position: absolute;
+    width: 200%;
+    height: 200%;
+    background: radial-gradient(circle, rgba(255,255,255,0.1) 1px, transparent 1px);
+    background-size: 20px 20px;
+    animation: slide 20s linear infinite;
+}
+
+@keyframes slide {
+    0% { transform: translate(0, 0); }
+    100% { transform: translate(20px, 20px); }
+}
+
+/* 不同类型的渐变背景 */
+.icon-bg.game {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+}
+
+.icon-bg.tool {
+    background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
+}
+
+.icon-bg.animation {
+    background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);
+}
+
+.icon-bg.graphics {
+    background: linear-gradient(135deg, #43e97b 0%, #38f9d7 100%);
+}
+
+.icon-bg.audio {
+    background: linear-gradient(135deg, #fa709a 0%, #fee140 100%);
+}
+
+.icon-bg.ui {
+    background: linear-gradient(135deg, #a8edea 0%, #fed6e3 100%);
+}
+
+.icon-bg.data {
+    background: linear-gradient(135deg, #ff9a9e 0%, #fecfef 100%);
+}
+
+.icon-emoji {
+    font-size: 5em;
+    position: relative;
+    z-index: 1;
+    animation: iconFloat 3s ease-in-out infinite;
+}
+
+@keyframes iconFloat {
+    0%, 100% { transform: translateY(0) scale(1); }
+    50% { transform: translateY(-10px) scale(1.05); }
+}
+
+/* 图片遮罩信息 */
+.item-overlay {
+    position: absolute;
+    bottom: 0;
+    left: 0;
+    right: 0;
+    padding: 30px 20px 20px;
+    background: linear-gradient(to top, rgba(15, 17, 26, 0.95), transparent);
+    opacity: 0;
+    transform: translateY(20px);
+    transition: all 0.3s ease;
+}
+
+.gallery-item:hover .item-overlay {
+    opacity: 1;
+    transform: translateY(0);
+}
+
+.item-category {
+    font-size: 0.75rem;
+    color: var(--primary-color);
+    text-transform: uppercase;
+    font-weight: 700;
+    margin-bottom: 4px;
+    display: block;
+}
+
+.item-title {
+    font-size: 1.1rem;
+    font-weight: 600;
+    color: white;
+}
+
+/* 卡片信息 */
+.card-info {
+    padding: 20px;
+}
+
+.card-header {
+    display: flex;
+    align-items: center;
+    gap: 10px;
+    margin-bottom: 8px;
+}
+
+.card-title {
+    font-size: 1.1rem;
+    font-weight: 600;
+    color: var(--text-main);
+    flex: 1;
+}
+
+.difficulty-badge {
+    padding: 4px 10px;
+    border-radius: 6px;
+    font-size: 0.75rem;
+    font-weight: 600;
+}
+
+.difficulty-简单 { background: #d1fae5; color: #065f46; }
+.difficulty-中 { background: #fed7aa; color: #92400e; }
+.difficulty-高 { background: #fecaca; color: #991b1b; }
+
+.card-category {
+    font-size: 0.8rem;
+    color: var(--text-muted);
+    margin-bottom: 8px;
+}
+
+.card-tags {
+    display: flex;
+    flex-wrap: wrap;
+    gap: 6px;
+    margin-bottom: 12px;
+}
+
+.tag {
+    padding: 3px 8px;
+    background: var(--bg-light);
+    border-radius: 4px;
+    font-size: 0.75rem;
+    color: var(--text-muted);
+}
+
+.card-prompt {
+    font-size: 0.85rem;
+    color: var(--text-muted);
+    margin-bottom: 12px;
+    overflow: hidden;
+    text-overflow: ellipsis;
+    display: -webkit-box;
+    -webkit-line-clamp: 2;
+    -webkit-box-orient: vertical;
+}
+
+.card-actions {
+    display: flex;
+    gap: 8px;
+}
+
+.btn {
+    padding: 8px 16px;
+    border-radius: 8px;
+    font-size: 0.85rem;
+    text-decoration: none;
+    cursor: pointer;
+    border: none;
+    transition: all 0.3s ease;
+    font-weight: 500;
+    display: inline-block;
+}
+
+.btn-primary {
+    background: linear-gradient(135deg, #ff758c 0%, #ff7eb3 100%);
+    color: white;
+}
+
+.btn-primary:hover {
+    box-shadow: var(--shadow-soft);
+    transform: translateY(-2px);
+}
+
+.btn-secondary {
+    background: var(--bg-light);
+    color: var(--text-main);
+    border: 1px solid var(--glass-border);
+}
+
+.btn-secondary:hover {
+    border-color: var(--primary-color);
+}
+
+/* Lightbox */
+.lightbox {
+    position: fixed;
+    top: 0;
+    left: 0;
+    width: 100%;
+    height: 100%;
+    background: rgba(0, 0, 0, 0.9);
+    display: flex;
+    justify-content: center;
+    align-items: center;
+    z-index: 1000;
+    opacity: 0;
+    pointer-events: none;
+    transition: opacity 0.3s ease;
+    backdrop-filter: blur(5px);
+}
+
+.lightbox.active {
+    opacity: 1;
+    pointer-events: all;
+}
+
+.lightbox-content {
+    max-width: 90%;
+    max-height: 85vh;
+    border-radius: 8px;
+    box-shadow: 0 0 50px rgba(0,0,0,0.5);
+    border: 1px solid var(--glass-border);
+}
+
+.close-btn {
+    position: absolute;
+    top: 30px;
+    right: 40px;
+    color: white;
+    font-size: 40px;
+    cursor: pointer;
+    transition: color 0.3s;
+}
+
+.close-btn:hover {
+    color: var(--primary-color);
+}
+
+/* 空状态 */
+.empty-state {
+    text-align: center;
+    padding: 60px 20px;
+    color: var(--text-muted);
+}
+
+.empty-state-icon {
+    font-size: 4em;
+    margin-bottom: 20px;
+    opacity: 0.3;
+}
+
+/* 底部 */
+footer {
+    text-align: center;
+    padding: 40px 0;
+    border-top: 1px solid var(--glass-border);
+    color: var(--text-muted);
+    font-size: 0.9rem;
+    margin-top: 50px;
+}
+
+footer strong {
+    color: var(--primary-color);
+}
+
+/* 响应式调整 */
+@media (max-width: 768px) {
+    h1 { font-size: 1.8rem; }
+    .stats-grid { grid-template-columns: 1fr 1fr; }
+    .gallery-grid { grid-template-columns: 1fr; }
+    .filter-buttons { flex-direction: column; }
+}
+'''.encode("utf-8")
+
+
+# 页面骨架为模块级常量，生成时只替换 $ 占位符（$$ 表示字面量 $）
+_HTML_TEMPLATE = Template('''<!DOCTYPE html>
 <html lang="zh-CN">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>AI模型测评结果 - {self.model_name} | 夕小瑶科技</title>
-    <style>
-        :root {{
-            --primary-color: #ff758c;
-            --secondary-color: #ff7eb3;
-            --accent-color: #726cf8;
-            --bg-light: #fdf2f8;
-            --bg-card: #ffffff;
-            --text-main: #374151;
-            --text-muted: #6b7280;
-            --gradient-brand: linear-gradient(135deg, #fce7f3 0%, #fbcfe8 100%);
-            --gradient-bg: linear-gradient(180deg, #fdf2f8 0%, #fce7f3 100%);
-            --glass-bg: rgba(255, 255, 255, 0.8);
-            --glass-border: rgba(255, 192, 203, 0.3);
-            --shadow-soft: 0 10px 30px -10px rgba(255, 117, 140, 0.2);
-        }}
-
-        * {{
-            box-sizing: border-box;
-            margin: 0;
-            padding: 0;
-        }}
-
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
-            background: var(--gradient-bg);
-            color: var(--text-main);
-            line-height: 1.6;
-            overflow-x: hidden;
-            min-height: 100vh;
-        }}
-
-        .container {{
-            max-width: 1400px;
-            margin: 0 auto;
-            padding: 0 20px;
-        }}
-
-        /* 头部设计 */
-        header {{
-            padding: 60px 0 40px;
-            text-align: center;
-            position: relative;
-        }}
-
-        .brand-avatar {{
-            width: 100px;
-            height: 100px;
-            border-radius: 50%;
-            margin: 0 auto 20px;
-            overflow: hidden;
-            box-shadow: 0 0 30px rgba(255, 117, 140, 0.3);
-            animation: float 6s ease-in-out infinite;
-        }}
-
-        .brand-avatar img {{
-            width: 100%;
-            height: 100%;
-            object-fit: cover;
-        }}
-
-        @keyframes float {{
-            0%, 100% {{ transform: translateY(0); }}
-            50% {{ transform: translateY(-10px); }}
-        }}
-
-        h1 {{
-            font-size: 2.5rem;
-            font-weight: 800;
-            margin-bottom: 10px;
-            background: linear-gradient(to right, #ec4899, #f472b6);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            letter-spacing: -1px;
-        }}
-
-        .subtitle {{
-            font-size: 1.1rem;
-            color: var(--text-muted);
-            margin-bottom: 20px;
-            font-weight: 300;
-        }}
-
-        /* 统计数据卡片 */
-        .stats-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
-            gap: 20px;
-            margin-bottom: 40px;
-            max-width: 1000px;
-            margin-left: auto;
-            margin-right: auto;
-        }}
-
-        .stat-card {{
-            background: var(--bg-card);
-            backdrop-filter: blur(10px);
-            border: 1px solid var(--glass-border);
-            padding: 20px;
-            border-radius: 16px;
-            text-align: center;
-            transition: transform 0.3s ease;
-            box-shadow: 0 4px 15px rgba(0,0,0,0.05);
-        }}
-
-        .stat-card:hover {{
-            transform: translateY(-5px);
-            border-color: var(--primary-color);
-        }}
-
-        .stat-value {{
-            font-size: 1.8rem;
-            font-weight: 700;
-            color: var(--primary-color);
-            display: block;
-        }}
-
-        .stat-label {{
-            font-size: 0.85rem;
-            color: var(--text-muted);
-            text-transform: uppercase;
-            letter-spacing: 1px;
-        }}
-
-        /* 搜索和筛选栏 */
-        .filter-bar {{
-            background: var(--bg-card);
-            border-radius: 16px;
-            padding: 20px;
-            margin-bottom: 30px;
-            box-shadow: 0 4px 15px rgba(0,0,0,0.05);
-            border: 1px solid var(--glass-border);
-        }}
-
-        .search-box {{
-            width: 100%;
-            padding: 12px 20px;
-            border: 2px solid var(--glass-border);
-            border-radius: 12px;
-            font-size: 1rem;
-            transition: all 0.3s ease;
-            margin-bottom: 15px;
-        }}
-
-        .search-box:focus {{
-            outline: none;
-            border-color: var(--primary-color);
-            box-shadow: 0 0 0 3px rgba(255, 117, 140, 0.1);
-        }}
-
-        .filter-buttons {{
-            display: flex;
-            flex-wrap: wrap;
-            gap: 10px;
-            margin-top: 10px;
-        }}
-
-        .filter-btn {{
-            padding: 8px 16px;
-            border: 2px solid var(--glass-border);
-            background: var(--bg-light);
-            border-radius: 8px;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            font-size: 0.9rem;
-            font-weight: 500;
-        }}
-
-        .filter-btn:hover {{
-            border-color: var(--primary-color);
-            background: white;
-        }}
-
-        .filter-btn.active {{
-            background: linear-gradient(135deg, #ff758c 0%, #ff7eb3 100%);
-            color: white;
-            border-color: var(--primary-color);
-        }}
-
-        /* 分类标题 */
-        .section-title {{
-            color: var(--text-main);
-            font-size: 1.8em;
-            margin: 50px 0 20px;
-            padding-left: 15px;
-            border-left: 4px solid var(--primary-color);
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }}
-
-        .result-count {{
-            font-size: 0.6em;
-            color: var(--text-muted);
-            font-weight: normal;
-        }}
-
-        /* 画廊网格 */
-        .gallery-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
-            gap: 24px;
-            padding-bottom: 50px;
-        }}
-
-        .gallery-item {{
-            position: relative;
-            border-radius: 16px;
-            overflow: hidden;
-            cursor: pointer;
-            background: var(--bg-card);
-            box-shadow: 0 4px 20px rgba(0,0,0,0.1);
-            transition: transform 0.4s cubic-bezier(0.165, 0.84, 0.44, 1);
-        }}
-
-        .gallery-item:hover {{
-            transform: scale(1.02) translateY(-5px);
-            z-index: 2;
-            box-shadow: 0 15px 40px rgba(255, 117, 140, 0.3);
-        }}
-
-        .gallery-img {{
-            width: 100%;
-            height: 250px;
-            object-fit: cover;
-            transition: transform 0.5s ease;
-        }}
-
-        .gallery-item:hover .gallery-img {{
-            transform: scale(1.1);
-        }}
-
-        /* 图标背景 */
-        .icon-bg {{
-            width: 100%;
-            height: 220px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            background: var(--gradient-brand);
-            position: relative;
-            overflow: hidden;
-        }}
-
-        .icon-bg::before {{
-            content: '';
-            position: absolute;
-            width: 200%;
-            height: 200%;
-            background: radial-gradient(circle, rgba(255,255,255,0.1) 1px, transparent 1px);
-            background-size: 20px 20px;
-            animation: slide 20s linear infinite;
-        }}
-
-        @keyframes slide {{
-            0% {{ transform: translate(0, 0); }}
-            100% {{ transform: translate(20px, 20px); }}
-        }}
-
-        /* 不同类型的渐变背景 */
-        .icon-bg.game {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        }}
-
-        .icon-bg.tool {{
-            background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
-        }}
-
-        .icon-bg.animation {{
-            background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);
-        }}
-
-        .icon-bg.graphics {{
-            background: linear-gradient(135deg, #43e97b 0%, #38f9d7 100%);
-        }}
-
-        .icon-bg.audio {{
-            background: linear-gradient(135deg, #fa709a 0%, #fee140 100%);
-        }}
-
-        .icon-bg.ui {{
-            background: linear-gradient(135deg, #a8edea 0%, #fed6e3 100%);
-        }}
-
-        .icon-bg.data {{
-            background: linear-gradient(135deg, #ff9a9e 0%, #fecfef 100%);
-        }}
-
-        .icon-emoji {{
-            font-size: 5em;
-            position: relative;
-            z-index: 1;
-            animation: iconFloat 3s ease-in-out infinite;
-        }}
-
-        @keyframes iconFloat {{
-            0%, 100% {{ transform: translateY(0) scale(1); }}
-            50% {{ transform: translateY(-10px) scale(1.05); }}
-        }}
-
-        /* 图片遮罩信息 */
-        .item-overlay {{
-            position: absolute;
-            bottom: 0;
-            left: 0;
-            right: 0;
-            padding: 30px 20px 20px;
-            background: linear-gradient(to top, rgba(15, 17, 26, 0.95), transparent);
-            opacity: 0;
-            transform: translateY(20px);
-            transition: all 0.3s ease;
-        }}
-
-        .gallery-item:hover .item-overlay {{
-            opacity: 1;
-            transform: translateY(0);
-        }}
-
-        .item-category {{
-            font-size: 0.75rem;
-            color: var(--primary-color);
-            text-transform: uppercase;
-            font-weight: 700;
-            margin-bottom: 4px;
-            display: block;
-        }}
-
-        .item-title {{
-            font-size: 1.1rem;
-            font-weight: 600;
-            color: white;
-        }}
-
-        /* 卡片信息 */
-        .card-info {{
-            padding: 20px;
-        }}
-
-        .card-header {{
-            display: flex;
-            align-items: center;
-            gap: 10px;
-            margin-bottom: 8px;
-        }}
-
-        .card-title {{
-            font-size: 1.1rem;
-            font-weight: 600;
-            color: var(--text-main);
-            flex: 1;
-        }}
-
-        .difficulty-badge {{
-            padding: 4px 10px;
-            border-radius: 6px;
-            font-size: 0.75rem;
-            font-weight: 600;
-        }}
-
-        .difficulty-简单 {{ background: #d1fae5; color: #065f46; }}
-        .difficulty-中 {{ background: #fed7aa; color: #92400e; }}
-        .difficulty-高 {{ background: #fecaca; color: #991b1b; }}
-
-        .card-category {{
-            font-size: 0.8rem;
-            color: var(--text-muted);
-            margin-bottom: 8px;
-        }}
-
-        .card-tags {{
-            display: flex;
-            flex-wrap: wrap;
-            gap: 6px;
-            margin-bottom: 12px;
-        }}
-
-        .tag {{
-            padding: 3px 8px;
-            background: var(--bg-light);
-            border-radius: 4px;
-            font-size: 0.75rem;
-            color: var(--text-muted);
-        }}
-
-        .card-prompt {{
-            font-size: 0.85rem;
-            color: var(--text-muted);
-            margin-bottom: 12px;
-            overflow: hidden;
-            text-overflow: ellipsis;
-            display: -webkit-box;
-            -webkit-line-clamp: 2;
-            -webkit-box-orient: vertical;
-        }}
-
-        .card-actions {{
-            display: flex;
-            gap: 8px;
-        }}
-
-        .btn {{
-            padding: 8px 16px;
-            border-radius: 8px;
-            font-size: 0.85rem;
-            text-decoration: none;
-            cursor: pointer;
-            border: none;
-            transition: all 0.3s ease;
-            font-weight: 500;
-            display: inline-block;
-        }}
-
-        .btn-primary {{
-            background: linear-gradient(135deg, #ff758c 0%, #ff7eb3 100%);
-            color: white;
-        }}
-
-        .btn-primary:hover {{
-            box-shadow: var(--shadow-soft);
-            transform: translateY(-2px);
-        }}
-
-        .btn-secondary {{
-            background: var(--bg-light);
-            color: var(--text-main);
-            border: 1px solid var(--glass-border);
-        }}
-
-        .btn-secondary:hover {{
-            border-color: var(--primary-color);
-        }}
-
-        /* Lightbox */
-        .lightbox {{
-            position: fixed;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            background: rgba(0, 0, 0, 0.9);
-            display: flex;
-            justify-content: center;
-            align-items: center;
-            z-index: 1000;
-            opacity: 0;
-            pointer-events: none;
-            transition: opacity 0.3s ease;
-            backdrop-filter: blur(5px);
-        }}
-
-        .lightbox.active {{
-            opacity: 1;
-            pointer-events: all;
-        }}
-
-        .lightbox-content {{
-            max-width: 90%;
-            max-height: 85vh;
-            border-radius: 8px;
-            box-shadow: 0 0 50px rgba(0,0,0,0.5);
-            border: 1px solid var(--glass-border);
-        }}
-
-        .close-btn {{
-            position: absolute;
-            top: 30px;
-            right: 40px;
-            color: white;
-            font-size: 40px;
-            cursor: pointer;
-            transition: color 0.3s;
-        }}
-
-        .close-btn:hover {{
-            color: var(--primary-color);
-        }}
-
-        /* 空状态 */
-        .empty-state {{
-            text-align: center;
-            padding: 60px 20px;
-            color: var(--text-muted);
-        }}
-
-        .empty-state-icon {{
-            font-size: 4em;
-            margin-bottom: 20px;
-            opacity: 0.3;
-        }}
-
-        /* 底部 */
-        footer {{
-            text-align: center;
-            padding: 40px 0;
-            border-top: 1px solid var(--glass-border);
-            color: var(--text-muted);
-            font-size: 0.9rem;
-            margin-top: 50px;
-        }}
-
-        footer strong {{
-            color: var(--primary-color);
-        }}
-
-        /* 响应式调整 */
-        @media (max-width: 768px) {{
-            h1 {{ font-size: 1.8rem; }}
-            .stats-grid {{ grid-template-columns: 1fr 1fr; }}
-            .gallery-grid {{ grid-template-columns: 1fr; }}
-            .filter-buttons {{ flex-direction: column; }}
-        }}
-    </style>
+    <title>AI模型测评结果 - $model_name | 夕小瑶科技</title>
+    <link rel="stylesheet" href="style.css">
 </head>
 <body>
     <div class="container">
@@ -689,31 +565,31 @@ class EnhancedWebsiteGenerator:
                 <img src="images/logo.png" alt="夕小瑶科技" onerror="this.style.display='none'">
             </div>
             <h1>AI模型测评结果</h1>
-            <p class="subtitle">{self.model_name}</p>
-            <p class="subtitle" style="font-size: 0.9em; opacity: 0.7;">生成时间: {data['meta']['generated_at'][:19]}</p>
+            <p class="subtitle">$model_name</p>
+            <p class="subtitle" style="font-size: 0.9em; opacity: 0.7;">生成时间: $generated_at</p>
 
             <div class="stats-grid">
                 <div class="stat-card">
-                    <span class="stat-value">{data['meta']['total_text']}</span>
+                    <span class="stat-value">$total_text</span>
                     <span class="stat-label">代码生成测试</span>
                 </div>
                 <div class="stat-card">
-                    <span class="stat-value">{data['meta'].get('total_writing', 0)}</span>
+                    <span class="stat-value">$total_writing</span>
                     <span class="stat-label">文生文测试</span>
                 </div>
                 <div class="stat-card">
-                    <span class="stat-value">{data['meta']['total_image']}</span>
+                    <span class="stat-value">$total_image</span>
                     <span class="stat-label">文生图测试</span>
                 </div>
                 <div class="stat-card">
-                    <span class="stat-value">{data['meta']['total_text'] + data['meta'].get('total_writing', 0) + data['meta']['total_image']}</span>
+                    <span class="stat-value">$total_all</span>
                     <span class="stat-label">总测试数</span>
                 </div>
             </div>
         </header>
 
         <!-- 统计数据可视化 -->
-        {self.generate_stats_section(data.get('stats', {}))}
+        $stats_section
 
         <!-- 搜索和筛选栏 -->
         <div class="filter-bar">
@@ -746,10 +622,10 @@ class EnhancedWebsiteGenerator:
         <div id="textSection">
             <h2 class="section-title">
                 <span>代码生成测评结果</span>
-                <span class="result-count" id="textCount">{len(data['text_results'])} 个案例</span>
+                <span class="result-count" id="textCount">$text_count 个案例</span>
             </h2>
             <div class="gallery-grid" id="textGallery">
-                {self.generate_text_cards(data['text_results'])}
+                $text_cards
             </div>
         </div>
 
@@ -757,10 +633,10 @@ class EnhancedWebsiteGenerator:
         <div id="writingSection">
             <h2 class="section-title">
                 <span>文生文测评结果</span>
-                <span class="result-count" id="writingCount">{len(data.get('writing_results', []))} 个案例</span>
+                <span class="result-count" id="writingCount">$writing_count 个案例</span>
             </h2>
             <div class="gallery-grid" id="writingGallery">
-                {self.generate_writing_cards(data.get('writing_results', []))}
+                $writing_cards
             </div>
         </div>
 
@@ -768,15 +644,15 @@ class EnhancedWebsiteGenerator:
         <div id="imageSection">
             <h2 class="section-title">
                 <span>文生图测评结果</span>
-                <span class="result-count" id="imageCount">{len(data['image_results'])} 个案例</span>
+                <span class="result-count" id="imageCount">$image_count 个案例</span>
             </h2>
             <div class="gallery-grid" id="imageGallery">
-                {self.generate_image_cards(data['image_results'])}
+                $image_cards
             </div>
         </div>
 
         <!-- 空状态 -->
-        <div id="emptyState" class="empty-state" style="display: none;">
+        <div id="emptyState" class="empty-state hidden">
             <div class="empty-state-icon">🔍</div>
             <h3>没有找到匹配的测试案例</h3>
             <p>试试调整搜索词或筛选条件</p>
@@ -805,188 +681,471 @@ class EnhancedWebsiteGenerator:
             </div>
             <div style="border-top: 1px solid var(--glass-border); padding-top: 20px;">
                 <strong style="color: var(--primary-color);">模型响应：</strong>
-                <div id="writingModalContent" style="margin-top: 10px; line-height: 1.8; color: var(--text-main);"></div>
+                <div id="writingModalContent" style="margin-top: 10px; line-height: 1.8; color: var(--text-main); white-space: pre-wrap;"></div>
             </div>
         </div>
     </div>
 
+    <!-- 文生文模态框数据：按 id 索引，整页只出现一次 -->
+    <script type="application/json" id="writingData">$writing_data</script>
+
     <script>
         // 搜索和筛选逻辑
         let currentFilter = 'all';
         let currentDifficulty = 'all';
 
-        // 搜索功能
-        document.getElementById('searchBox').addEventListener('input', function(e) {{
-            filterResults();
-        }});
-
-        // 类型筛选
-        document.querySelectorAll('[data-filter]').forEach(btn => {{
-            btn.addEventListener('click', function() {{
-                document.querySelectorAll('[data-filter]').forEach(b => b.classList.remove('active'));
-                this.classList.add('active');
-                currentFilter = this.dataset.filter;
-                filterResults();
-            }});
-        }});
-
-        // 难度筛选
-        document.querySelectorAll('[data-difficulty]').forEach(btn => {{
-            btn.addEventListener('click', function() {{
-                document.querySelectorAll('[data-difficulty]').forEach(b => b.classList.remove('active'));
-                this.classList.add('active');
-                currentDifficulty = this.dataset.difficulty;
+        // 页面加载时缓存常用节点，之后的筛选与弹窗不再重复查找
+        const searchBox = document.getElementById('searchBox');
+        const emptyState = document.getElementById('emptyState');
+        const lightbox = document.getElementById('lightbox');
+        const lightboxImg = document.getElementById('lightbox-img');
+        const writingModal = document.getElementById('writingModal');
+        const writingModalTitle = document.getElementById('writingModalTitle');
+        const writingModalPrompt = document.getElementById('writingModalPrompt');
+        const writingModalContent = document.getElementById('writingModalContent');
+        const filterButtons = document.getElementsByClassName('filter-btn');
+        // 各分区的卡片、计数与区域节点；卡片的搜索串和难度在加载时一次取出，按键时只查这两个数组
+        const sections = ['text', 'writing', 'image'].map(type => {
+            const items = Array.from(document.getElementById(type + 'Gallery').getElementsByClassName('gallery-item'));
+            return {
+                type: type,
+                items: items,
+                search: items.map(item => item.dataset.search),
+                difficulty: items.map(item => item.dataset.difficulty),
+                // 上次筛选时的搜索词与命中卡片的下标，卡片的 search-miss 类始终与之一致
+                term: '',
+                hits: items.map((item, i) => i),
+                count: document.getElementById(type + 'Count'),
+                section: document.getElementById(type + 'Section'),
+            };
+        });
+
+        // 搜索功能：连续输入时等停顿 80ms 再筛选，一串按键只筛选一次
+        const SEARCH_DELAY = 80;
+        let searchTimer = 0;
+
+        searchBox.addEventListener('input', function(e) {
+            clearTimeout(searchTimer);
+            searchTimer = setTimeout(filterResults, SEARCH_DELAY);
+        });
+
+        // 同一组按钮（data-filter 或 data-difficulty）中只高亮取值为 value 的那个
+        function setActiveButton(key, value) {
+            for (const btn of filterButtons) {
+                if (key in btn.dataset) btn.classList.toggle('active', btn.dataset[key] === value);
+            }
+        }
+
+        // 类型筛选 / 难度筛选
+        for (const btn of filterButtons) {
+            btn.addEventListener('click', function() {
+                if ('filter' in this.dataset) {
+                    currentFilter = this.dataset.filter;
+                    setActiveButton('filter', currentFilter);
+                } else {
+                    currentDifficulty = this.dataset.difficulty;
+                    setActiveButton('difficulty', currentDifficulty);
+                }
                 filterResults();
-            }});
-        }});
-
-        function filterResults() {{
-            const searchTerm = document.getElementById('searchBox').value.toLowerCase();
-            let visibleTextCount = 0;
-            let visibleWritingCount = 0;
-            let visibleImageCount = 0;
-
-            // 筛选代码生成
-            document.querySelectorAll('#textGallery .gallery-item').forEach(item => {{
-                const matchesSearch = !searchTerm ||
-                    item.dataset.name.toLowerCase().includes(searchTerm) ||
-                    item.dataset.tags.toLowerCase().includes(searchTerm) ||
-                    item.dataset.id.toLowerCase().includes(searchTerm);
-
-                const matchesFilter = currentFilter === 'all' || currentFilter === 'text';
-                const matchesDifficulty = currentDifficulty === 'all' || item.dataset.difficulty === currentDifficulty;
-
-                if (matchesSearch && matchesFilter && matchesDifficulty) {{
-                    item.style.display = '';
-                    visibleTextCount++;
-                }} else {{
-                    item.style.display = 'none';
-                }}
-            }});
-
-            // 筛选文生文
-            document.querySelectorAll('#writingGallery .gallery-item').forEach(item => {{
-                const matchesSearch = !searchTerm ||
-                    item.dataset.name.toLowerCase().includes(searchTerm) ||
-                    item.dataset.tags.toLowerCase().includes(searchTerm) ||
-                    item.dataset.id.toLowerCase().includes(searchTerm);
-
-                const matchesFilter = currentFilter === 'all' || currentFilter === 'writing';
-                const matchesDifficulty = currentDifficulty === 'all' || item.dataset.difficulty === currentDifficulty;
-
-                if (matchesSearch && matchesFilter && matchesDifficulty) {{
-                    item.style.display = '';
-                    visibleWritingCount++;
-                }} else {{
-                    item.style.display = 'none';
-                }}
-            }});
-
-            // 筛选文生图
-            document.querySelectorAll('#imageGallery .gallery-item').forEach(item => {{
-                const matchesSearch = !searchTerm ||
-                    item.dataset.name.toLowerCase().includes(searchTerm) ||
-                    item.dataset.tags.toLowerCase().includes(searchTerm) ||
-                    item.dataset.id.toLowerCase().includes(searchTerm);
-
-                const matchesFilter = currentFilter === 'all' || currentFilter === 'image';
-                const matchesDifficulty = currentDifficulty === 'all' || item.dataset.difficulty === currentDifficulty;
-
-                if (matchesSearch && matchesFilter && matchesDifficulty) {{
-                    item.style.display = '';
-                    visibleImageCount++;
-                }} else {{
-                    item.style.display = 'none';
-                }}
-            }});
-
-            // 更新计数
-            document.getElementById('textCount').textContent = `${{visibleTextCount}} 个案例`;
-            document.getElementById('writingCount').textContent = `${{visibleWritingCount}} 个案例`;
-            document.getElementById('imageCount').textContent = `${{visibleImageCount}} 个案例`;
-
-            // 显示/隐藏区域
-            document.getElementById('textSection').style.display =
-                (currentFilter === 'all' || currentFilter === 'text') && visibleTextCount > 0 ? '' : 'none';
-            document.getElementById('writingSection').style.display =
-                (currentFilter === 'all' || currentFilter === 'writing') && visibleWritingCount > 0 ? '' : 'none';
-            document.getElementById('imageSection').style.display =
-                (currentFilter === 'all' || currentFilter === 'image') && visibleImageCount > 0 ? '' : 'none';
+            });
+        }
+
+        // 难度筛选只切换 body 上的一个类名，由 CSS 隐藏不匹配的卡片；
+        // 搜索只在卡片命中状态变化时才写 class，计数只读 dataset，不触发重排
+        const difficultyClasses = ['filter-diff-简单', 'filter-diff-中', 'filter-diff-高'];
+
+        // 第一遍只读：算出分区的可见卡片数，以及命中状态需要翻转的卡片
+        function scanSection(sec, searchTerm) {
+            const shown = currentFilter === 'all' || currentFilter === sec.type;
+            // 隐藏的分区不必扫描，切换回来时会重新筛选
+            if (!shown) return { sec: sec, shown: false, visible: 0, flips: [], hits: null };
+            // 新搜索词包含上次的搜索词时，只可能命中上次命中的卡片，其余卡片已是 search-miss
+            const candidates = searchTerm.includes(sec.term) ? sec.hits : sec.items.map((item, i) => i);
+            const hits = [];
+            const flips = [];
+            let visible = 0;
+            for (const i of candidates) {
+                const miss = searchTerm !== '' && !sec.search[i].includes(searchTerm);
+                if (sec.items[i].classList.contains('search-miss') !== miss) flips.push(sec.items[i]);
+                if (miss) continue;
+                hits.push(i);
+                if (currentDifficulty === 'all' || sec.difficulty[i] === currentDifficulty) visible++;
+            }
+            return { sec: sec, shown: true, visible: visible, flips: flips, hits: hits };
+        }
+
+        function applyFilters() {
+            const searchTerm = searchBox.value.toLowerCase();
+            const scans = sections.map(sec => scanSection(sec, searchTerm));
+
+            // 第二遍集中写入：类名、计数、区域显隐一次完成
+            document.body.classList.remove(...difficultyClasses);
+            if (currentDifficulty !== 'all') document.body.classList.add('filter-diff-' + currentDifficulty);
+            let totalVisible = 0;
+            for (const scan of scans) {
+                for (const item of scan.flips) item.classList.toggle('search-miss');
+                if (scan.hits) {
+                    scan.sec.term = searchTerm;
+                    scan.sec.hits = scan.hits;
+                }
+                scan.sec.count.textContent = `$${scan.visible} 个案例`;
+                scan.sec.section.classList.toggle('hidden', !(scan.shown && scan.visible > 0));
+                totalVisible += scan.visible;
+            }
 
             // 显示空状态
-            const totalVisible = visibleTextCount + visibleWritingCount + visibleImageCount;
-            document.getElementById('emptyState').style.display = totalVisible === 0 ? 'block' : 'none';
-        }}
+            emptyState.classList.toggle('hidden', totalVisible !== 0);
+        }
+
+        // 同一帧内的多次筛选请求合并为一次，在下一帧渲染前统一执行
+        let filterPending = false;
+
+        function filterResults() {
+            if (filterPending) return;
+            filterPending = true;
+            requestAnimationFrame(() => {
+                filterPending = false;
+                applyFilters();
+            });
+        }
 
-        function resetFilters() {{
-            document.getElementById('searchBox').value = '';
+        function resetFilters() {
+            clearTimeout(searchTimer);
+            searchBox.value = '';
             currentFilter = 'all';
             currentDifficulty = 'all';
-            document.querySelectorAll('[data-filter]').forEach(b => b.classList.remove('active'));
-            document.querySelector('[data-filter="all"]').classList.add('active');
-            document.querySelectorAll('[data-difficulty]').forEach(b => b.classList.remove('active'));
-            document.querySelector('[data-difficulty="all"]').classList.add('active');
+            setActiveButton('filter', 'all');
+            setActiveButton('difficulty', 'all');
             filterResults();
-        }}
+        }
 
         // Lightbox功能
-        function openLightbox(src) {{
-            document.getElementById('lightbox-img').src = src;
-            document.getElementById('lightbox').classList.add('active');
-        }}
+        function openLightbox(src) {
+            // 卡片图片是懒加载的，大图是用户正在等的那张，优先获取
+            lightboxImg.fetchPriority = 'high';
+            lightboxImg.src = src;
+            lightbox.classList.add('active');
+        }
 
-        function closeLightbox() {{
-            document.getElementById('lightbox').classList.remove('active');
-        }}
+        function closeLightbox() {
+            lightbox.classList.remove('active');
+        }
 
         // Writing Modal功能
-        function showWritingModal(id, title, prompt, content) {{
-            document.getElementById('writingModalTitle').textContent = title;
-            document.getElementById('writingModalPrompt').textContent = prompt;
-            document.getElementById('writingModalContent').innerHTML = content;
-            document.getElementById('writingModal').classList.add('active');
-        }}
-
-        function closeWritingModal() {{
-            document.getElementById('writingModal').classList.remove('active');
-        }}
-
-        document.getElementById('writingModal').addEventListener('click', function(e) {{
+        function showWritingModal(id, title, prompt, content) {
+            writingModalTitle.textContent = title;
+            writingModalPrompt.textContent = prompt;
+            writingModalContent.textContent = content;
+            writingModal.classList.add('active');
+        }
+
+        function closeWritingModal() {
+            writingModal.classList.remove('active');
+        }
+
+        // 卡片点击统一委托到分区容器，卡片上不再逐个内联 onclick
+        document.getElementById('imageSection').addEventListener('click', function(e) {
+            const img = e.target.closest('[data-lightbox-src]');
+            if (img) openLightbox(img.dataset.lightboxSrc);
+        });
+
+        // 模态框数据在第一次打开时才解析
+        let writingData = null;
+
+        document.getElementById('writingSection').addEventListener('click', function(e) {
+            const btn = e.target.closest('[data-writing-id]');
+            if (!btn) return;
+            writingData = writingData || JSON.parse(document.getElementById('writingData').textContent);
+            const id = btn.dataset.writingId;
+            const entry = writingData[id];
+            if (entry) showWritingModal(id, entry.name, entry.prompt, entry.content);
+        });
+
+        writingModal.addEventListener('click', function(e) {
             if (e.target === this) closeWritingModal();
-        }});
+        });
 
-        document.getElementById('lightbox').addEventListener('click', function(e) {{
+        lightbox.addEventListener('click', function(e) {
             if (e.target === this) closeLightbox();
-        }});
+        });
 
-        document.addEventListener('keydown', function(e) {{
-            if (e.key === 'Escape') {{
+        document.addEventListener('keydown', function(e) {
+            if (e.key === 'Escape') {
                 closeLightbox();
                 closeWritingModal();
-            }}
-        }});
+            }
+        });
     </script>
 </body>
-</html>'''
-        return html
-
-    def generate_stats_section(self, stats):
-        """生成统计数据可视化部分"""
-        text_stats = stats.get('text', {})
-        writing_stats = stats.get('writing', {})
-        image_stats = stats.get('image', {})
-
-        # 计算平均值
-        avg_speed = []
-        if text_stats.get('avg_tokens_per_second', 0) > 0:
-            avg_speed.append(text_stats['avg_tokens_per_second'])
-        if writing_stats.get('avg_tokens_per_second', 0) > 0:
-            avg_speed.append(writing_stats['avg_tokens_per_second'])
-        if image_stats.get('avg_tokens_per_second', 0) > 0:
-            avg_speed.append(image_stats['avg_tokens_per_second'])
-        overall_avg_speed = sum(avg_speed) / len(avg_speed) if avg_speed else 0
-
-        html = f'''
+</html>''')
+
+
+def _split_template(template):
+    """把 Template 预先拆成 [字面量, 占位符名, 字面量, ...]，便于分段输出"""
+    src = template.template
+    parts = []
+    literal = []
+    pos = 0
+    for m in template.pattern.finditer(src):
+        literal.append(src[pos:m.start()])
+        pos = m.end()
+        if m.group("escaped") is not None:
+            literal.append(template.delimiter)
+        elif m.group("invalid") is not None:
+            raise ValueError(f"模板占位符无效: 位置 {m.start()}")
+        else:
+            parts.append("".join(literal))
+            parts.append(m.group("named") or m.group("braced"))
+            literal = []
+    literal.append(src[pos:])
+    parts.append("".join(literal))
+    return parts
+
+
+_HTML_SEGMENTS = _split_template(_HTML_TEMPLATE)
+# 写文件用的版本：字面量（样式链接、页面骨架、脚本）在导入时一次编码成 UTF-8，生成时只需编码动态内容
+_HTML_SEGMENTS_UTF8 = [part.encode("utf-8") if i % 2 == 0 else part for i, part in enumerate(_HTML_SEGMENTS)]
+
+
+# HTML 转义表：str.translate 一次遍历完成全部替换
+_HTML_ESCAPE_TABLE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#39;",
+})
+
+# 转义的同时把换行换成空格（预览用），一次 translate 完成
+_HTML_ESCAPE_INLINE_TABLE = {**_HTML_ESCAPE_TABLE, ord("\n"): " "}
+
+
+def _escape(value):
+    """转义插入HTML文本或属性中的字段"""
+    return str(value).translate(_HTML_ESCAPE_TABLE)
+
+
+def _to_utf8(value):
+    """把占位符内容转成 UTF-8 bytes"""
+    return str(value).encode("utf-8")
+
+
+def _script_json(obj):
+    """序列化为可直接嵌入 <script> 的 JSON；'<' 一律写成 \\u003c，内容无法提前结束脚本块"""
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).replace("<", "\\u003c")
+
+
+def _read_json_file(path):
+    """读取并解析单个结果文件，异常作为返回值交给调用方统一处理"""
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+        if orjson is not None:
+            try:
+                return orjson.loads(raw), None
+            except orjson.JSONDecodeError:
+                # orjson 不接受 NaN/Infinity，交给标准库兜底
+                pass
+        return json.loads(raw), None
+    except Exception as e:
+        return None, e
+
+
+def _canonical_bytes(obj):
+    """按键排序序列化，用作内容摘要的输入"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, sort_keys=True).encode("utf-8")
+
+
+def _content_hash(data, options=b""):
+    """计算页面内容的哈希（不含生成时间），用于判断结果是否有变化
+
+    options 为影响输出文件格式的选项，选项变化时即使结果相同也要重新生成。
+    """
+    meta = {k: v for k, v in data["meta"].items() if not k.startswith("generated_at")}
+    h = hashlib.blake2b(_canonical_bytes(dict(data, meta=meta)), digest_size=16)
+    # 生成器本身（模板、样式、字段裁剪逻辑）变化时也要重新生成
+    h.update(_GENERATOR_DIGEST)
+    h.update(options)
+    return h.hexdigest()
+
+
+# 存在时才原样保留的可选字段（顺序即 data.json 中的字段顺序）
+_OPTIONAL_RESULT_KEYS = ("html_file", "image_file", "txt_file", "response", "char_count")
+# collect_results 与 _simplify_result 会用到的全部字段，读取结果文件时只保留这些
+_RESULT_FIELDS = ("id", "name", "category", "difficulty", "tags", "icon", "prompt", "success", "timestamp") + _OPTIONAL_RESULT_KEYS
+# 响应内容只保留这么长用于预览
+_RESPONSE_PREVIEW_LEN = 500
+# 解析缓存里记录的格式标识，裁剪字段或预览长度变化后旧缓存自动作废
+_RESULTS_CACHE_SCHEMA = [*_RESULT_FIELDS, _RESPONSE_PREVIEW_LEN]
+
+
+def _stage_file(path, write, mode="wb", **kwargs):
+    """调用 write(f) 把内容写到 path 旁的临时文件并 fsync，返回临时文件路径，由调用方统一 os.replace"""
+    tmp = f"{path}.tmp"
+    try:
+        with open(tmp, mode, **kwargs) as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    return tmp
+
+
+def _stage_bytes(path, payload):
+    """把已在内存中的 bytes 用 os.write 直接写到临时文件并 fsync，不经过 Python 的缓冲层；返回临时文件路径"""
+    tmp = f"{path}.tmp"
+    try:
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o666)
+        try:
+            # 通常一次写完；被信号打断等短写时从断点继续
+            view = memoryview(payload)
+            written = 0
+            while written < len(view):
+                written += os.write(fd, view[written:])
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    return tmp
+
+
+def _fsync_dir(path):
+    """把目录项（os.replace 的重命名）落盘；Windows 不支持对目录 fsync，直接跳过"""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+# 已渲染的分区片段，按 (分区, 输入摘要) 缓存；GUI 在同一进程内反复生成时，未变化的分区直接复用
+_FRAGMENT_CACHE = {}
+_FRAGMENT_CACHE_SIZE = 16
+
+
+def _memoized_fragments(kind, payload, produce):
+    """产出一个分区的 HTML 片段；payload 与上次相同时直接复用上次的渲染结果"""
+    key = (kind, hashlib.blake2b(_canonical_bytes(payload), digest_size=16).digest())
+    cached = _FRAGMENT_CACHE.get(key)
+    if cached is not None:
+        yield from cached
+        return
+    fragments = []
+    for fragment in produce():
+        fragments.append(fragment)
+        yield fragment
+    # 完整渲染完才写入缓存；超出上限时整体清空，避免长期运行时无限增长
+    if len(_FRAGMENT_CACHE) >= _FRAGMENT_CACHE_SIZE:
+        _FRAGMENT_CACHE.clear()
+    _FRAGMENT_CACHE[key] = fragments
+
+
+def _search_text(r):
+    """拼接卡片的小写搜索串（名称、标签、ID），非字符串字段一律先转成字符串"""
+    return " ".join([str(r.get("name") or ""), " ".join(map(str, r.get("tags") or ())), str(r.get("id") or "")]).lower()
+
+
+def _simplify_result(r):
+    """精简单条结果，只保留网站展示所需字段"""
+    get = r.get
+    prompt = get("prompt", "")
+    simple_r = {
+        # id 为 null 时归一成空串、非字符串时转成字符串，保证 itemgetter("id") 排序时类型一致
+        "id": str(get("id") or ""),
+        # name 为 null 时同样归一成空串，拼搜索串时不会因类型出错
+        "name": get("name") or "",
+        "category": get("category", "未分类"),
+        "difficulty": get("difficulty", "中"),
+        "tags": get("tags", []),
+        "icon": get("icon", "📄"),
+        "prompt": prompt[:300],
+        # 卡片上的短预览在收集时截好，渲染时直接复用
+        "prompt_short": prompt[:100],
+        # 是否被截断也一并记下，卡片据此决定是否加省略号
+        "prompt_truncated": len(prompt) > 100,
+        "success": get("success", True),
+        "timestamp": get("timestamp", "")
+    }
+    for key in _OPTIONAL_RESULT_KEYS:
+        if key in r:
+            simple_r[key] = r[key]
+    if "response" in simple_r:
+        # 截取响应内容用于预览
+        simple_r["response"] = (simple_r["response"] or "")[:_RESPONSE_PREVIEW_LEN]
+    # 预先拼好小写的搜索串，页面搜索时无需对每张卡片反复 toLowerCase()
+    simple_r["search"] = _search_text(simple_r)
+    return simple_r
+
+
+def _read_result_file(path):
+    """在读取线程里解析结果文件并立即裁掉用不到的字段和过长的响应，完整结果不在线程间堆积"""
+    data, error = _read_json_file(path)
+    if error is not None:
+        return None, error
+    if not isinstance(data, dict):
+        # 顶层不是对象的文件按读取失败处理，也不进入解析缓存
+        return None, ValueError(f"结果文件顶层应为 JSON 对象，实际为 {type(data).__name__}")
+    projected = {key: data[key] for key in _RESULT_FIELDS if key in data}
+    response = projected.get("response")
+    if isinstance(response, str) and len(response) > _RESPONSE_PREVIEW_LEN:
+        projected["response"] = response[:_RESPONSE_PREVIEW_LEN]
+    return projected, None
+
+
+def _success_rate(stats):
+    """成功率（百分比），没有案例时为 0"""
+    total = stats.get('total_cases', 0)
+    return stats.get('success_count', 0) / total * 100 if total > 0 else 0
+
+
+# 分类 -> 卡片背景样式类
+_CATEGORY_BG_CLASS = {
+    '交互游戏': 'game',
+    '实用工具': 'tool',
+    '动画效果': 'animation',
+    '3D图形': 'graphics',
+    '视觉代码生成': 'graphics',
+    '视觉效果': 'graphics',
+    '音频可视化': 'audio',
+    '多媒体': 'audio',
+    'UI布局': 'ui',
+    '数据可视化': 'data',
+    '算法/模拟': 'data',
+    '科学模拟': 'data',
+    # 文生文分类
+    '新闻写作': 'tool',
+    '营销文案': 'ui',
+    '技术写作': 'data',
+    '创意写作': 'animation',
+    '商务写作': 'tool',
+    '知识解答': 'data',
+    '演讲写作': 'ui',
+    '说明文写作': 'tool',
+    '评论写作': 'graphics',
+    '应用写作': 'tool',
+    '科普写作': 'data',
+    '产品写作': 'ui',
+    '议论写作': 'game',
+    '叙事写作': 'animation',
+}
+
+
+# 统计区 HTML 模板，字段由 generate_stats_section 计算后用 format_map 填入
+_STATS_TMPL = '''
         <div style="background: white; border-radius: 16px; padding: 30px; margin-bottom: 40px; box-shadow: 0 4px 15px rgba(0,0,0,0.05);">
             <h2 style="font-size: 1.5rem; margin-bottom: 25px; color: var(--text-main); border-left: 4px solid var(--primary-color); padding-left: 15px;">
                 📊 性能统计数据
@@ -996,33 +1155,33 @@ class EnhancedWebsiteGenerator:
                 <!-- 代码生成统计 -->
                 <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 20px; border-radius: 12px; color: white;">
                     <div style="font-size: 0.9rem; opacity: 0.9; margin-bottom: 8px;">🔨 代码生成</div>
-                    <div style="font-size: 1.8rem; font-weight: 700; margin-bottom: 8px;">{text_stats.get('avg_tokens_per_second', 0):.1f} <span style="font-size: 0.8rem;">tok/s</span></div>
-                    <div style="font-size: 0.85rem; opacity: 0.8;">平均响应: {text_stats.get('avg_time_per_case', 0):.1f}s</div>
-                    <div style="font-size: 0.85rem; opacity: 0.8;">成功率: {(text_stats.get('success_count', 0) / text_stats.get('total_cases', 1) * 100) if text_stats.get('total_cases', 0) > 0 else 0:.1f}%</div>
+                    <div style="font-size: 1.8rem; font-weight: 700; margin-bottom: 8px;">{text_speed:.1f} <span style="font-size: 0.8rem;">tok/s</span></div>
+                    <div style="font-size: 0.85rem; opacity: 0.8;">平均响应: {text_time:.1f}s</div>
+                    <div style="font-size: 0.85rem; opacity: 0.8;">成功率: {text_rate:.1f}%</div>
                 </div>
 
                 <!-- 文生文统计 -->
                 <div style="background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); padding: 20px; border-radius: 12px; color: white;">
                     <div style="font-size: 0.9rem; opacity: 0.9; margin-bottom: 8px;">✍️ 文生文</div>
-                    <div style="font-size: 1.8rem; font-weight: 700; margin-bottom: 8px;">{writing_stats.get('avg_tokens_per_second', 0):.1f} <span style="font-size: 0.8rem;">tok/s</span></div>
-                    <div style="font-size: 0.85rem; opacity: 0.8;">平均响应: {writing_stats.get('avg_time_per_case', 0):.1f}s</div>
-                    <div style="font-size: 0.85rem; opacity: 0.8;">成功率: {(writing_stats.get('success_count', 0) / writing_stats.get('total_cases', 1) * 100) if writing_stats.get('total_cases', 0) > 0 else 0:.1f}%</div>
+                    <div style="font-size: 1.8rem; font-weight: 700; margin-bottom: 8px;">{writing_speed:.1f} <span style="font-size: 0.8rem;">tok/s</span></div>
+                    <div style="font-size: 0.85rem; opacity: 0.8;">平均响应: {writing_time:.1f}s</div>
+                    <div style="font-size: 0.85rem; opacity: 0.8;">成功率: {writing_rate:.1f}%</div>
                 </div>
 
                 <!-- 文生图统计 -->
                 <div style="background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%); padding: 20px; border-radius: 12px; color: white;">
                     <div style="font-size: 0.9rem; opacity: 0.9; margin-bottom: 8px;">🎨 文生图</div>
-                    <div style="font-size: 1.8rem; font-weight: 700; margin-bottom: 8px;">{image_stats.get('avg_tokens_per_second', 0):.1f} <span style="font-size: 0.8rem;">tok/s</span></div>
-                    <div style="font-size: 0.85rem; opacity: 0.8;">平均响应: {image_stats.get('avg_time_per_case', 0):.1f}s</div>
-                    <div style="font-size: 0.85rem; opacity: 0.8;">成功率: {(image_stats.get('success_count', 0) / image_stats.get('total_cases', 1) * 100) if image_stats.get('total_cases', 0) > 0 else 0:.1f}%</div>
+                    <div style="font-size: 1.8rem; font-weight: 700; margin-bottom: 8px;">{image_speed:.1f} <span style="font-size: 0.8rem;">tok/s</span></div>
+                    <div style="font-size: 0.85rem; opacity: 0.8;">平均响应: {image_time:.1f}s</div>
+                    <div style="font-size: 0.85rem; opacity: 0.8;">成功率: {image_rate:.1f}%</div>
                 </div>
 
                 <!-- 综合统计 -->
                 <div style="background: linear-gradient(135deg, #fa709a 0%, #fee140 100%); padding: 20px; border-radius: 12px; color: white;">
                     <div style="font-size: 0.9rem; opacity: 0.9; margin-bottom: 8px;">⚡ 综合性能</div>
                     <div style="font-size: 1.8rem; font-weight: 700; margin-bottom: 8px;">{overall_avg_speed:.1f} <span style="font-size: 0.8rem;">tok/s</span></div>
-                    <div style="font-size: 0.85rem; opacity: 0.8;">总用时: {text_stats.get('total_time_seconds', 0) + writing_stats.get('total_time_seconds', 0) + image_stats.get('total_time_seconds', 0):.1f}s</div>
-                    <div style="font-size: 0.85rem; opacity: 0.8;">总tokens: {text_stats.get('total_tokens', {}).get('total_tokens', 0) + writing_stats.get('total_tokens', {}).get('total_tokens', 0) + image_stats.get('total_tokens', {}).get('total_tokens', 0):,}</div>
+                    <div style="font-size: 0.85rem; opacity: 0.8;">总用时: {total_time:.1f}s</div>
+                    <div style="font-size: 0.85rem; opacity: 0.8;">总tokens: {total_tokens:,}</div>
                 </div>
             </div>
 
@@ -1032,19 +1191,19 @@ class EnhancedWebsiteGenerator:
                 <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(180px, 1fr)); gap: 15px;">
                     <div>
                         <div style="font-size: 0.85rem; color: var(--text-muted); margin-bottom: 5px;">输入Tokens</div>
-                        <div style="font-size: 1.5rem; font-weight: 600; color: var(--primary-color);">{text_stats.get('total_tokens', {}).get('prompt_tokens', 0) + writing_stats.get('total_tokens', {}).get('prompt_tokens', 0) + image_stats.get('total_tokens', {}).get('prompt_tokens', 0):,}</div>
+                        <div style="font-size: 1.5rem; font-weight: 600; color: var(--primary-color);">{total_prompt:,}</div>
                     </div>
                     <div>
                         <div style="font-size: 0.85rem; color: var(--text-muted); margin-bottom: 5px;">输出Tokens</div>
-                        <div style="font-size: 1.5rem; font-weight: 600; color: var(--primary-color);">{text_stats.get('total_tokens', {}).get('completion_tokens', 0) + writing_stats.get('total_tokens', {}).get('completion_tokens', 0) + image_stats.get('total_tokens', {}).get('completion_tokens', 0):,}</div>
+                        <div style="font-size: 1.5rem; font-weight: 600; color: var(--primary-color);">{total_completion:,}</div>
                     </div>
                     <div>
                         <div style="font-size: 0.85rem; color: var(--text-muted); margin-bottom: 5px;">平均输出/案例</div>
-                        <div style="font-size: 1.5rem; font-weight: 600; color: var(--primary-color);">{((text_stats.get('avg_output_tokens_per_case', 0) + writing_stats.get('avg_output_tokens_per_case', 0) + image_stats.get('avg_output_tokens_per_case', 0)) / 3):.0f}</div>
+                        <div style="font-size: 1.5rem; font-weight: 600; color: var(--primary-color);">{avg_output:.0f}</div>
                     </div>
                     <div>
                         <div style="font-size: 0.85rem; color: var(--text-muted); margin-bottom: 5px;">总重试次数</div>
-                        <div style="font-size: 1.5rem; font-weight: 600; color: var(--primary-color);">{text_stats.get('retry_count', 0) + writing_stats.get('retry_count', 0) + image_stats.get('retry_count', 0)}</div>
+                        <div style="font-size: 1.5rem; font-weight: 600; color: var(--primary-color);">{total_retries}</div>
                     </div>
                 </div>
             </div>
@@ -1055,9 +1214,7 @@ class EnhancedWebsiteGenerator:
                 <div style="background: white; padding: 20px; border: 1px solid var(--glass-border); border-radius: 12px;">
                     <h4 style="font-size: 1rem; margin-bottom: 15px; color: var(--text-main);">生成速度对比 (tok/s)</h4>
                     <div style="display: flex; flex-direction: column; gap: 10px;">
-                        {self.generate_bar('代码生成', text_stats.get('avg_tokens_per_second', 0), overall_avg_speed if overall_avg_speed > 0 else 100, '#667eea')}
-                        {self.generate_bar('文生文', writing_stats.get('avg_tokens_per_second', 0), overall_avg_speed if overall_avg_speed > 0 else 100, '#f5576c')}
-                        {self.generate_bar('文生图', image_stats.get('avg_tokens_per_second', 0), overall_avg_speed if overall_avg_speed > 0 else 100, '#00f2fe')}
+                        {speed_bars}
                     </div>
                 </div>
 
@@ -1065,20 +1222,15 @@ class EnhancedWebsiteGenerator:
                 <div style="background: white; padding: 20px; border: 1px solid var(--glass-border); border-radius: 12px;">
                     <h4 style="font-size: 1rem; margin-bottom: 15px; color: var(--text-main);">测试成功率 (%)</h4>
                     <div style="display: flex; flex-direction: column; gap: 10px;">
-                        {self.generate_bar('代码生成', (text_stats.get('success_count', 0) / text_stats.get('total_cases', 1) * 100) if text_stats.get('total_cases', 0) > 0 else 0, 100, '#10b981')}
-                        {self.generate_bar('文生文', (writing_stats.get('success_count', 0) / writing_stats.get('total_cases', 1) * 100) if writing_stats.get('total_cases', 0) > 0 else 0, 100, '#10b981')}
-                        {self.generate_bar('文生图', (image_stats.get('success_count', 0) / image_stats.get('total_cases', 1) * 100) if image_stats.get('total_cases', 0) > 0 else 0, 100, '#10b981')}
+                        {rate_bars}
                     </div>
                 </div>
             </div>
         </div>
         '''
-        return html
 
-    def generate_bar(self, label, value, max_value, color):
-        """生成单个条形图"""
-        percentage = (value / max_value * 100) if max_value > 0 else 0
-        return f'''
+# 统计区的单个条形图
+_BAR_TMPL = '''
         <div>
             <div style="display: flex; justify-content: space-between; margin-bottom: 5px;">
                 <span style="font-size: 0.85rem; color: var(--text-muted);">{label}</span>
@@ -1089,202 +1241,735 @@ class EnhancedWebsiteGenerator:
             </div>
         </div>
         '''
+# 同一组条形图之间的分隔（与模板中的缩进保持一致）
+_BAR_SEP = "\n                        "
 
-    def generate_text_cards(self, results):
-        """生成代码生成卡片（带图标）"""
-        cards = []
-        for r in results:
-            icon = r.get('icon', '📄')
-            difficulty = r.get('difficulty', '中')
-            category = r.get('category', '未分类')
-            tags = r.get('tags', [])
-            tags_html = ''.join([f'<span class="tag">{tag}</span>' for tag in tags[:3]])
 
-            # 根据分类选择背景样式
-            bg_class = self.get_category_bg_class(category)
+def _bars(rows):
+    """一次生成一组条形图，rows 为 (标签, 数值, 最大值, 颜色) 列表"""
+    return _BAR_SEP.join([
+        _BAR_TMPL.format(label=label, value=value, color=color,
+                         percentage=(value / max_value * 100) if max_value > 0 else 0)
+        for label, value, max_value, color in rows
+    ])
+
 
-            html_btn = ""
-            if r.get("html_file"):
-                html_btn = f'<a href="{r["html_file"]}" target="_blank" class="btn btn-primary">查看演示</a>'
+# 单个标签（传入已转义的标签文本）
+_TAG_SPAN = '<span class="tag">{}</span>'.format
 
-            card = f'''
-            <div class="gallery-item" data-name="{r.get('name', '')}" data-id="{r.get('id', '')}" data-tags="{' '.join(tags)}" data-difficulty="{difficulty}">
-                <div class="icon-bg {bg_class}">
-                    <div class="icon-emoji">{icon}</div>
+# 卡片 HTML 模板：模块加载时定义一次，渲染时用 format_map 填入已转义的字段
+_TEXT_CARD_TMPL = '''
+        <div class="gallery-item diff-{difficulty}" data-name="{name_html}" data-id="{rid_html}" data-tags="{tags_joined}" data-difficulty="{difficulty}" data-search="{search}">
+            <div class="icon-bg {bg_class}">
+                <div class="icon-emoji">{icon}</div>
+            </div>
+            <div class="card-info">
+                <div class="card-header">
+                    <div class="card-title">{name_html}</div>
+                    <span class="difficulty-badge difficulty-{difficulty}">{difficulty}</span>
+                </div>
+                <div class="card-category">📁 {category_html}</div>
+                <div class="card-tags">{tags_html}</div>
+                <div class="card-prompt">{prompt_html}{ellipsis}</div>
+                <div class="card-actions">
+                    {html_btn}
                 </div>
-                <div class="card-info">
-                    <div class="card-header">
-                        <div class="card-title">{r.get('name', '未命名')}</div>
-                        <span class="difficulty-badge difficulty-{difficulty}">{difficulty}</span>
+            </div>
+        </div>
+        '''
+
+_WRITING_CARD_TMPL = '''
+        <div class="gallery-item writing-card diff-{difficulty}" data-name="{name_html}" data-id="{rid_html}" data-tags="{tags_joined}" data-difficulty="{difficulty}" data-search="{search}">
+            <!-- 图标头部 -->
+            <div class="icon-bg {bg_class}" style="height: 160px; position: relative;">
+                <div class="icon-emoji" style="font-size: 4.5em; position: relative; z-index: 2;">{icon}</div>
+                <div style="position: absolute; bottom: 15px; left: 0; right: 0; text-align: center; z-index: 2;">
+                    <span style="background: rgba(255,255,255,0.95); padding: 6px 16px; border-radius: 20px; font-size: 0.85rem; font-weight: 600; color: var(--text-main);">
+                        {category_html}
+                    </span>
+                </div>
+            </div>
+
+            <!-- 卡片内容 -->
+            <div class="card-info" style="padding: 24px 20px;">
+                <!-- 标题行 -->
+                <div class="card-header" style="margin-bottom: 12px;">
+                    <div class="card-title" style="font-size: 1.15rem; line-height: 1.4;">{name_html}</div>
+                    <span class="difficulty-badge difficulty-{difficulty}">{difficulty}</span>
+                </div>
+
+                <!-- 统计信息 -->
+                <div style="display: flex; gap: 15px; margin-bottom: 12px; padding: 10px; background: var(--bg-light); border-radius: 8px;">
+                    <div style="flex: 1; text-align: center;">
+                        <div style="font-size: 1.3rem; font-weight: 700; color: var(--primary-color);">{char_count}</div>
+                        <div style="font-size: 0.75rem; color: var(--text-muted);">字数</div>
                     </div>
-                    <div class="card-category">📁 {category}</div>
-                    <div class="card-tags">{tags_html}</div>
-                    <div class="card-prompt">{r.get('prompt', '')[:100]}...</div>
-                    <div class="card-actions">
-                        {html_btn}
+                    <div style="width: 1px; background: var(--glass-border);"></div>
+                    <div style="flex: 1; text-align: center;">
+                        <div style="font-size: 1.3rem; font-weight: 700; color: var(--accent-color);">{tag_count}</div>
+                        <div style="font-size: 0.75rem; color: var(--text-muted);">标签</div>
                     </div>
+                    <div style="width: 1px; background: var(--glass-border);"></div>
+                    <div style="flex: 1; text-align: center;">
+                        <div style="font-size: 1.3rem; font-weight: 700; color: #10b981;">✓</div>
+                        <div style="font-size: 0.75rem; color: var(--text-muted);">完成</div>
+                    </div>
+                </div>
+
+                <!-- 标签 -->
+                <div class="card-tags" style="margin-bottom: 12px;">
+                    {tags_html}
+                </div>
+
+                <!-- 提示词预览 -->
+                <div style="background: #f8f9fa; padding: 12px; border-radius: 8px; margin-bottom: 12px; border-left: 3px solid var(--primary-color);">
+                    <div style="font-size: 0.75rem; color: var(--text-muted); margin-bottom: 4px; font-weight: 600;">📋 提示词</div>
+                    <div style="font-size: 0.85rem; color: var(--text-main); line-height: 1.5;">{prompt_preview}</div>
+                </div>
+
+                <!-- 响应内容预览 -->
+                <div style="background: linear-gradient(to bottom, #ffffff, #f8f9fa); padding: 14px; border-radius: 10px; border: 1px solid var(--glass-border); margin-bottom: 15px;">
+                    <div style="font-size: 0.75rem; color: var(--text-muted); margin-bottom: 6px; font-weight: 600;">✨ 响应内容预览</div>
+                    <div style="font-size: 0.9rem; color: var(--text-main); line-height: 1.7; max-height: 105px; overflow: hidden; text-overflow: ellipsis;">{response_preview_html}</div>
+                </div>
+
+                <!-- 操作按钮 -->
+                <div class="card-actions">
+                    <button class="btn btn-primary" data-writing-id="{rid_html}" style="width: 100%; justify-content: center; display: flex; align-items: center; gap: 8px;">
+                        <span>📖</span>
+                        <span>查看完整内容</span>
+                    </button>
                 </div>
             </div>
-            '''
-            cards.append(card)
-        return "".join(cards)
+        </div>
+        '''
 
-    def get_category_bg_class(self, category):
-        """根据分类返回背景样式类"""
-        category_map = {
-            '交互游戏': 'game',
-            '实用工具': 'tool',
-            '动画效果': 'animation',
-            '3D图形': 'graphics',
-            '视觉代码生成': 'graphics',
-            '视觉效果': 'graphics',
-            '音频可视化': 'audio',
-            '多媒体': 'audio',
-            'UI布局': 'ui',
-            '数据可视化': 'data',
-            '算法/模拟': 'data',
-            '科学模拟': 'data',
-            # 文生文分类
-            '新闻写作': 'tool',
-            '营销文案': 'ui',
-            '技术写作': 'data',
-            '创意写作': 'animation',
-            '商务写作': 'tool',
-            '知识解答': 'data',
-            '演讲写作': 'ui',
-            '说明文写作': 'tool',
-            '评论写作': 'graphics',
-            '应用写作': 'tool',
-            '科普写作': 'data',
-            '产品写作': 'ui',
-            '议论写作': 'game',
-            '叙事写作': 'animation',
+_IMAGE_CARD_TMPL = '''
+        <div class="gallery-item diff-{difficulty}" data-name="{name_html}" data-id="{rid_html}" data-tags="{tags_joined}" data-difficulty="{difficulty}" data-search="{search}">
+            {img_html}
+            <div class="item-overlay">
+                <span class="item-category">{category_html}</span>
+                <div class="item-title">{name_html}</div>
+            </div>
+        </div>
+        '''
+
+# 卡片类型到模板的映射，渲染流程见 EnhancedWebsiteGenerator._card_renderer
+_CARD_TEMPLATES = {
+    "text": _TEXT_CARD_TMPL,
+    "writing": _WRITING_CARD_TMPL,
+    "image": _IMAGE_CARD_TMPL,
+}
+
+
+def _generator_digest():
+    """生成器摘要：对本模块源码取哈希，模板、样式、字段构建逻辑任一变化都会使其改变
+
+    读不到源码时（如只分发 .pyc）退回到对全部模板常量取哈希。
+    """
+    h = hashlib.blake2b(_CSS_BYTES, digest_size=16)
+    try:
+        with open(__file__, "rb") as f:
+            h.update(f.read())
+    except OSError:
+        for tmpl in (_HTML_TEMPLATE.template, _STATS_TMPL, _BAR_TMPL, _TAG_SPAN.__self__, *_CARD_TEMPLATES.values()):
+            h.update(tmpl.encode("utf-8"))
+            h.update(b"\0")
+    return h.digest()
+
+
+# 只在导入时算一次，内容哈希和输入指纹直接复用
+_GENERATOR_DIGEST = _generator_digest()
+
+
+class EnhancedWebsiteGenerator:
+    # 并发读取结果文件的线程数
+    READ_WORKERS = 16
+
+    def __init__(self, output_dir, model_name="AI Model", pretty=False, compress=False, msgpack_sidecar=False):
+        self.output_dir = Path(output_dir)
+        self.model_name = model_name
+        # data.json 只给页面脚本读取，默认紧凑输出；调试时可传 pretty=True 缩进
+        self.pretty = pretty
+        # compress=True 时数据文件改为 gzip 压缩的 data.json.gz，体积通常只有原来的几分之一
+        self.compress = compress
+        # msgpack_sidecar=True 时另写一份 data.msgpack 供脚本读取：msgpack.unpack(open(path, "rb"), raw=False)
+        if msgpack_sidecar and msgpack is None:
+            raise ImportError("需要安装 msgpack 库")
+        self.msgpack_sidecar = msgpack_sidecar
+        # 结果文件解析缓存："{类型}/{文件名}" -> [mtime_ns, 大小, 裁剪后的记录]；generate() 从上次保存的缓存载入，
+        # collect_results 把本次用到的条目记入 _results_cache_next，收集完再整体保存
+        self._results_cache = {}
+        self._results_cache_next = {}
+
+    def generate(self):
+        """生成展示网站"""
+        website_dir = self.output_dir / "website"
+        data_path = website_dir / ("data.json.gz" if self.compress else "data.json")
+        msgpack_path = website_dir / "data.msgpack"
+        html_path = website_dir / "index.html"
+        css_path = website_dir / "style.css"
+        hash_path = website_dir / ".content_hash"
+        fp_path = website_dir / ".fp"
+        # 解析缓存放在 website 目录之外：website 目录会整体部署，缓存里的结果预览不应随之发布
+        cache_path = self.output_dir / ".website_cache.json"
+        outputs_exist = data_path.exists() and html_path.exists() and css_path.exists()
+        if self.msgpack_sidecar:
+            outputs_exist = outputs_exist and msgpack_path.exists()
+
+        # 输入文件（名称、mtime、大小）与上次完全一致时，连结果文件都不用读
+        fingerprint = self._input_fingerprint()
+        if outputs_exist:
+            try:
+                if fp_path.read_bytes() == fingerprint:
+                    print("[website] 输入文件未变化，跳过重新生成")
+                    return html_path
+            except OSError:
+                pass
+
+        # 上次解析过且 mtime、大小都没变的结果文件直接复用缓存的记录，不再读取
+        self._results_cache = self._load_results_cache(cache_path)
+        self._results_cache_next = {}
+
+        # 收集结果数据：三个目录互不相关，并发扫描（与 collect_results 内部的线程池嵌套无妨，都是 I/O 密集）
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            text_future = pool.submit(self.collect_results, "text")
+            writing_future = pool.submit(self.collect_results, "writing")
+            image_future = pool.submit(self.collect_results, "image")
+            text_results = text_future.result()
+            writing_results = writing_future.result()
+            image_results = image_future.result()
+
+        # 只保存本次仍存在的文件，已删除文件的条目随之清掉
+        self._save_results_cache(cache_path, self._results_cache_next)
+        # 之前写在 website 目录里的解析缓存（含本机绝对路径）一并删除，不随网站部署
+        try:
+            os.remove(website_dir / ".results_cache.json")
+        except OSError:
+            pass
+
+        # 加载统计数据
+        text_stats = self.load_stats("text")
+        writing_stats = self.load_stats("writing")
+        image_stats = self.load_stats("image")
+
+        # 生成时间只取一次，精确到秒，页面直接展示无需再截断
+        generated_at = datetime.now().isoformat(timespec="seconds")
+
+        # 生成精简数据文件（collect_results 已只保留展示所需字段）
+        data = {
+            "meta": {
+                "model": self.model_name,
+                "generated_at": generated_at,
+                "total_text": len(text_results),
+                "total_writing": len(writing_results),
+                "total_image": len(image_results),
+                "total_all": len(text_results) + len(writing_results) + len(image_results)
+            },
+            "text_results": text_results,
+            "writing_results": writing_results,
+            "image_results": image_results,
+            "stats": {
+                "text": text_stats,
+                "writing": writing_stats,
+                "image": image_stats
+            }
         }
-        return category_map.get(category, '')
 
-    def generate_writing_cards(self, results):
-        """生成文生文卡片（优化版 - 更美观完整）"""
-        cards = []
-        for r in results:
-            icon = r.get('icon', '📝')
-            difficulty = r.get('difficulty', '中')
-            category = r.get('category', '未分类')
-            tags = r.get('tags', [])
-            tags_html = ''.join([f'<span class="tag">{tag}</span>' for tag in tags[:4]])
+        # 结果与上次生成时完全一致则跳过写入（只是文件被重写过，顺带更新输入指纹）
+        content_hash = _content_hash(data, self._output_options()).encode("ascii")
+        if outputs_exist:
+            try:
+                if hash_path.read_bytes() == content_hash:
+                    print("[website] 测试结果未变化，跳过重新生成")
+                    fp_path.write_bytes(fingerprint)
+                    return html_path
+            except OSError:
+                pass
+
+        # 输出文件互不依赖，并发写入各自的临时文件以重叠磁盘刷新
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [
+                (pool.submit(self._write_data_json, data_path, data), data_path),
+                (pool.submit(self._write_html, html_path, data), html_path),
+                (pool.submit(self._write_css, css_path), css_path),
+            ]
+            if self.msgpack_sidecar:
+                futures.append((pool.submit(self._write_msgpack, msgpack_path, data), msgpack_path))
+        staged = [(future.result(), final) for future, final in futures if future.exception() is None]
+        failed = [future.exception() for future, _ in futures if future.exception() is not None]
+        if failed:
+            # 任一文件失败则丢弃其余临时文件，保留上一次的完整输出
+            for tmp, _ in staged:
+                if tmp is not None:
+                    os.remove(tmp)
+            raise failed[0]
+        staged.append((_stage_bytes(hash_path, content_hash), hash_path))
+        staged.append((_stage_bytes(fp_path, fingerprint), fp_path))
+
+        # 全部写好后再统一替换（哈希与指纹文件最后），页面和数据不会出现一新一旧；目录只 fsync 一次
+        for tmp, final in staged:
+            if tmp is not None:
+                os.replace(tmp, final)
+        _fsync_dir(website_dir)
+        return html_path
 
-            # 根据分类选择背景样式
-            bg_class = self.get_category_bg_class(category)
+    def _output_options(self):
+        """影响输出文件内容的选项，同时计入内容哈希和输入指纹"""
+        return f"pretty={self.pretty}\0compress={self.compress}\0msgpack_sidecar={self.msgpack_sidecar}\0".encode("utf-8")
+
+    def _input_fingerprint(self):
+        """输入指纹：三个结果目录下每个文件的名称、mtime、大小，加上模型名、输出选项和生成器摘要"""
+        h = hashlib.blake2b(digest_size=16)
+        h.update(_GENERATOR_DIGEST)
+        h.update(f"{self.model_name}\0".encode("utf-8"))
+        h.update(self._output_options())
+        for test_type in ("text", "writing", "image"):
+            h.update(f"[{test_type}]".encode("utf-8"))
+            try:
+                with os.scandir(os.path.join(self.output_dir, test_type)) as it:
+                    entries = sorted((entry for entry in it if entry.is_file()), key=lambda entry: entry.name)
+            except FileNotFoundError:
+                continue
+            for entry in entries:
+                st = entry.stat()
+                h.update(f"{entry.name}\0{st.st_mtime_ns}\0{st.st_size}\n".encode("utf-8"))
+        return h.hexdigest().encode("ascii")
+
+    @staticmethod
+    def _write_css(css_path):
+        """写出 style.css 的临时文件；内容未变时不重写（返回 None），浏览器缓存保持有效"""
+        try:
+            if css_path.read_bytes() == _CSS_BYTES:
+                return None
+        except OSError:
+            pass
+        return _stage_bytes(css_path, _CSS_BYTES)
+
+    def _write_data_json(self, data_path, data):
+        """写出 data.json 的临时文件；compress 时写成 gzip 压缩的 data.json.gz"""
+        if not self.compress:
+            if orjson is not None:
+                # orjson 一次得到完整 bytes，直接一次 os.write 写出
+                return _stage_bytes(data_path, self._orjson_dumps(data))
+            return _stage_file(data_path, partial(self._dump_data, data))
+
+        def write(f):
+            # 不记录文件名、mtime 固定为 0，内容相同时压缩结果逐字节一致
+            with gzip.GzipFile(filename="", mode="wb", fileobj=f, compresslevel=6, mtime=0) as gz:
+                self._dump_data(data, gz)
+
+        return _stage_file(data_path, write)
+
+    def _orjson_dumps(self, data):
+        """用 orjson 把 data 序列化为 bytes，按 pretty 决定是否缩进"""
+        option = orjson.OPT_NON_STR_KEYS
+        if self.pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+
+    def _dump_data(self, data, f):
+        """把 data 序列化为 JSON 写入二进制文件对象 f"""
+        if orjson is not None:
+            # orjson 在 C 里一次得到完整 bytes，一次写入
+            f.write(self._orjson_dumps(data))
+            return
+        # 标准库回退时边编码边写入，不先拼出整份 JSON 字符串再整体编码成 bytes
+        if self.pretty:
+            encoder = json.JSONEncoder(ensure_ascii=False, indent=2)
+        else:
+            encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+        f.writelines(chunk.encode("utf-8") for chunk in encoder.iterencode(data))
+
+    @staticmethod
+    def _write_msgpack(msgpack_path, data):
+        """写出 data.msgpack 的临时文件（与 data.json 内容相同的二进制格式）"""
+        return _stage_bytes(msgpack_path, msgpack.packb(data, use_bin_type=True))
+
+    def _write_html(self, html_path, data):
+        """写出 index.html 的临时文件（分段写入，避免整页字符串和文件缓冲区同时驻留内存）"""
+        # 二进制写入：字面量已是 bytes，动态片段逐段编码，不经过文本层
+        return _stage_file(html_path, partial(self.generate_html, data))
+
+    @staticmethod
+    def _load_results_cache(cache_path):
+        """加载结果文件的解析缓存；文件缺失、损坏或记录格式已变化时返回空缓存"""
+        cache, error = _read_json_file(cache_path)
+        if error is not None or not isinstance(cache, dict) or cache.get("schema") != _RESULTS_CACHE_SCHEMA:
+            return {}
+        return cache.get("entries", {})
 
-            # 获取响应内容预览（更长的预览）
-            response_preview = r.get('response', '')[:350] if r.get('response') else ''
-            response_preview_html = response_preview.replace('<', '&lt;').replace('>', '&gt;').replace('\n', ' ').replace('"', '&quot;')
-            if len(r.get('response', '')) > 350:
-                response_preview_html += '...'
+    @staticmethod
+    def _save_results_cache(cache_path, entries):
+        """保存结果文件的解析缓存；保存失败只提示，不影响页面生成"""
+        payload = {"schema": _RESULTS_CACHE_SCHEMA, "entries": entries}
+        try:
+            if orjson is not None:
+                raw = orjson.dumps(payload)
+            else:
+                raw = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            os.replace(_stage_bytes(cache_path, raw), cache_path)
+        except Exception as e:
+            print(f"警告: 无法保存解析缓存: {e}")
 
-            # 完整响应用于模态框显示（保留换行）
-            full_response = r.get('response', '').replace('<', '&lt;').replace('>', '&gt;').replace('\n', '<br>').replace('"', '&quot;')
+    def load_stats(self, test_type):
+        """加载统计数据"""
+        # 与结果文件共用读取逻辑（优先 orjson），文件缺失或损坏都按无统计处理
+        stats, error = _read_json_file(os.path.join(self.output_dir, test_type, "_stats.json"))
+        return stats if error is None else {}
 
-            # 字数统计
-            char_count = r.get('char_count', len(r.get('response', '')))
-
-            # 提示词预览
-            prompt_preview = r.get('prompt', '')[:120]
-            if len(r.get('prompt', '')) > 120:
-                prompt_preview += '...'
-
-            card = f'''
-            <div class="gallery-item writing-card" data-name="{r.get('name', '')}" data-id="{r.get('id', '')}" data-tags="{' '.join(tags)}" data-difficulty="{difficulty}">
-                <!-- 图标头部 -->
-                <div class="icon-bg {bg_class}" style="height: 160px; position: relative;">
-                    <div class="icon-emoji" style="font-size: 4.5em; position: relative; z-index: 2;">{icon}</div>
-                    <div style="position: absolute; bottom: 15px; left: 0; right: 0; text-align: center; z-index: 2;">
-                        <span style="background: rgba(255,255,255,0.95); padding: 6px 16px; border-radius: 20px; font-size: 0.85rem; font-weight: 600; color: var(--text-main);">
-                            {category}
-                        </span>
-                    </div>
-                </div>
+    def collect_results(self, test_type):
+        """收集测试结果（只收集成功的案例），返回精简后的结果"""
+        # 目录内部一律用字符串路径，避免热循环里反复构造 Path 对象
+        result_dir = os.path.join(self.output_dir, test_type)
+        # 页面引用同级文件的相对路径前缀，按目录算一次
+        link_prefix = f"../{test_type}/"
+        results = []
+        skipped = []
 
-                <!-- 卡片内容 -->
-                <div class="card-info" style="padding: 24px 20px;">
-                    <!-- 标题行 -->
-                    <div class="card-header" style="margin-bottom: 12px;">
-                        <div class="card-title" style="font-size: 1.15rem; line-height: 1.4;">{r.get('name', '未命名')}</div>
-                        <span class="difficulty-badge difficulty-{difficulty}">{difficulty}</span>
-                    </div>
+        # 一次 scandir 遍历目录得到全部文件名，之后的同名文件检查都是集合查找，不再逐个 exists()
+        names = set()
+        json_entries = []
+        try:
+            with os.scandir(result_dir) as it:
+                for entry in it:
+                    # is_file() 直接用 scandir 返回的类型信息，不额外 stat；子目录不参与匹配
+                    if not entry.is_file():
+                        continue
+                    name = entry.name
+                    names.add(name)
+                    # 跳过统计文件
+                    if name.endswith(".json") and not name.startswith("_"):
+                        json_entries.append(entry)
+        except FileNotFoundError:
+            return results
 
-                    <!-- 统计信息 -->
-                    <div style="display: flex; gap: 15px; margin-bottom: 12px; padding: 10px; background: var(--bg-light); border-radius: 8px;">
-                        <div style="flex: 1; text-align: center;">
-                            <div style="font-size: 1.3rem; font-weight: 700; color: var(--primary-color);">{char_count}</div>
-                            <div style="font-size: 0.75rem; color: var(--text-muted);">字数</div>
-                        </div>
-                        <div style="width: 1px; background: var(--glass-border);"></div>
-                        <div style="flex: 1; text-align: center;">
-                            <div style="font-size: 1.3rem; font-weight: 700; color: var(--accent-color);">{len(tags)}</div>
-                            <div style="font-size: 0.75rem; color: var(--text-muted);">标签</div>
-                        </div>
-                        <div style="width: 1px; background: var(--glass-border);"></div>
-                        <div style="flex: 1; text-align: center;">
-                            <div style="font-size: 1.3rem; font-weight: 700; color: #10b981;">✓</div>
-                            <div style="font-size: 0.75rem; color: var(--text-muted);">完成</div>
-                        </div>
-                    </div>
+        if not json_entries:
+            return results
 
-                    <!-- 标签 -->
-                    <div class="card-tags" style="margin-bottom: 12px;">
-                        {tags_html}
-                    </div>
+        # 先按文件名（{id}_{name}.json）排好再读取：读取与跳过提示的顺序固定，
+        # 结果基本已按 id 有序，最后的 sort 只需线性时间
+        json_entries.sort(key=lambda entry: entry.name)
+
+        # 命中解析缓存（mtime 与大小都未变）的文件直接用缓存的记录，其余文件才需要读取
+        cache = self._results_cache
+        cache_next = self._results_cache_next
+        loaded = [None] * len(json_entries)
+        to_read = []
+        # 缓存键用相对于输出目录的路径：不暴露本机绝对路径，项目目录移动后缓存仍然有效
+        for i, entry in enumerate(json_entries):
+            st = entry.stat()
+            key = f"{test_type}/{entry.name}"
+            hit = cache.get(key)
+            if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+                loaded[i] = (hit[2], None)
+                cache_next[key] = hit
+            else:
+                to_read.append((i, entry, st))
+
+        if to_read:
+            # 结果文件读取是 I/O 密集型，用线程池并发读取和解析
+            with ThreadPoolExecutor(max_workers=min(self.READ_WORKERS, len(to_read))) as pool:
+                fresh = pool.map(_read_result_file, [entry.path for _, entry, _ in to_read])
+                for (i, entry, st), (data, error) in zip(to_read, fresh):
+                    loaded[i] = (data, error)
+                    # 读取失败的不缓存，下次重新读取
+                    if error is None:
+                        cache_next[f"{test_type}/{entry.name}"] = [st.st_mtime_ns, st.st_size, data]
+
+        for entry, (data, error) in zip(json_entries, loaded):
+            if error is not None:
+                print(f"读取结果失败 {entry.path}: {error}")
+                continue
 
-                    <!-- 提示词预览 -->
-                    <div style="background: #f8f9fa; padding: 12px; border-radius: 8px; margin-bottom: 12px; border-left: 3px solid var(--primary-color);">
-                        <div style="font-size: 0.75rem; color: var(--text-muted); margin-bottom: 4px; font-weight: 600;">📋 提示词</div>
-                        <div style="font-size: 0.85rem; color: var(--text-main); line-height: 1.5;">{prompt_preview}</div>
-                    </div>
+            # 单个文件内容异常（如顶层不是对象、字段类型不对）只跳过该文件，不影响其余结果
+            try:
+                base_name = entry.name[:-5]
 
-                    <!-- 响应内容预览 -->
-                    <div style="background: linear-gradient(to bottom, #ffffff, #f8f9fa); padding: 14px; border-radius: 10px; border: 1px solid var(--glass-border); margin-bottom: 15px;">
-                        <div style="font-size: 0.75rem; color: var(--text-muted); margin-bottom: 6px; font-weight: 600;">✨ 响应内容预览</div>
-                        <div style="font-size: 0.9rem; color: var(--text-main); line-height: 1.7; max-height: 105px; overflow: hidden; text-overflow: ellipsis;">{response_preview_html}</div>
-                    </div>
+                # 检查是否成功
+                if not data.get("success", True):
+                    skipped.append(data.get("id", base_name))
+                    continue
 
-                    <!-- 操作按钮 -->
-                    <div class="card-actions">
-                        <button class="btn btn-primary" onclick="showWritingModal('{r.get('id', '')}', '{r.get('name', '').replace(chr(39), chr(92)+chr(39))}', '{r.get('prompt', '').replace(chr(39), chr(92)+chr(39)).replace(chr(10), ' ')[:200]}', `{full_response}`)" style="width: 100%; justify-content: center; display: flex; align-items: center; gap: 8px;">
-                            <span>📖</span>
-                            <span>查看完整内容</span>
-                        </button>
-                    </div>
-                </div>
-            </div>
-            '''
-            cards.append(card)
-        return "".join(cards)
+                # 记录同时存放在解析缓存里，附加同级文件路径前先复制一份
+                data = dict(data)
+                if test_type == "text":
+                    # 检查是否有HTML文件
+                    html_name = f"{base_name}.html"
+                    if html_name in names:
+                        data["html_file"] = link_prefix + html_name
+                    else:
+                        # 没有HTML文件，跳过
+                        skipped.append(data.get("id", base_name))
+                        continue
+                elif test_type == "writing":
+                    # 文生文测试，检查txt文件
+                    txt_name = f"{base_name}.txt"
+                    if txt_name in names:
+                        data["txt_file"] = link_prefix + txt_name
+                    # 文生文不强制要求txt文件，因为response已经在json中
+                    results.append(_simplify_result(data))
+                    continue
+                else:
+                    # 检查是否有图片文件
+                    found_image = False
+                    for ext in ("png", "jpg", "jpeg"):
+                        img_name = f"{base_name}.{ext}"
+                        if img_name in names:
+                            data["image_file"] = link_prefix + img_name
+                            found_image = True
+                            break
+                    if not found_image:
+                        # 没有图片文件，跳过
+                        skipped.append(data.get("id", base_name))
+                        continue
+
+                # 收集时直接精简，不再保留完整结果再做二次遍历
+                results.append(_simplify_result(data))
+            except Exception as e:
+                print(f"读取结果失败 {entry.path}: {e}")
+
+        if skipped:
+            print(f"[{test_type}] 跳过 {len(skipped)} 个失败/无输出的案例: {', '.join(skipped)}")
+
+        # _simplify_result 保证每条记录都有 id，可直接用 C 实现的 itemgetter 排序
+        results.sort(key=itemgetter("id"))
+        return results
+
+    def generate_html(self, data, fp=None):
+        """生成增强版HTML页面；传入 fp（二进制文件）时按片段编码后直接写入，不拼接整页字符串"""
+        meta = data['meta']
+        slots = {
+            "model_name": _escape(self.model_name),
+            "generated_at": meta['generated_at'],
+            "total_text": meta['total_text'],
+            "total_writing": meta.get('total_writing', 0),
+            "total_image": meta['total_image'],
+            "total_all": meta['total_all'],
+            "stats_section": lambda: self._render_section("stats", data.get('stats', {})),
+            "text_count": len(data['text_results']),
+            "text_cards": lambda: self._render_section("text", data['text_results']),
+            "writing_count": len(data.get('writing_results', [])),
+            "writing_cards": lambda: self._render_section("writing", data.get('writing_results', [])),
+            "image_count": len(data['image_results']),
+            "image_cards": lambda: self._render_section("image", data['image_results']),
+            "writing_data": lambda: self._render_section("writing_data", data.get('writing_results', [])),
+        }
+        if fp is None:
+            return "".join(self._iter_template(_HTML_SEGMENTS, slots))
+        fp.writelines(self._iter_template(_HTML_SEGMENTS_UTF8, slots, _to_utf8))
+
+    def _render_section(self, kind, payload):
+        """按分区渲染统计区、卡片列表或模态框数据，经 _memoized_fragments 复用未变化的分区"""
+        if kind == "stats":
+            produce = lambda: [self.generate_stats_section(payload)]
+        elif kind == "writing_data":
+            produce = lambda: [self.generate_writing_data(payload)]
+        else:
+            render = self._card_renderer(kind)
+            produce = lambda: map(render, payload)
+        # 子类可能重写渲染方法，缓存按类区分
+        return _memoized_fragments((type(self), kind), payload, produce)
+
+    @staticmethod
+    def _iter_template(segments, slots, convert=str):
+        """依次产出模板字面量和占位符内容
+
+        耗时的占位符（卡片等）以可调用对象给出，返回片段的可迭代对象，写到该处时才逐张渲染。
+        字面量按 segments 原样产出（可以是预先编码的 bytes），占位符内容经 convert 转换后产出。
+        """
+        for i, part in enumerate(segments):
+            if i % 2 == 0:
+                yield part
+            else:
+                value = slots[part]
+                if callable(value):
+                    yield from map(convert, value())
+                else:
+                    yield convert(value)
+
+    def generate_stats_section(self, stats):
+        """生成统计数据可视化部分"""
+        text_stats = stats.get('text', {})
+        writing_stats = stats.get('writing', {})
+        image_stats = stats.get('image', {})
+
+        # 各项汇总值先算好，再一次性填入 _STATS_TMPL
+        text_speed = text_stats.get('avg_tokens_per_second', 0)
+        writing_speed = writing_stats.get('avg_tokens_per_second', 0)
+        image_speed = image_stats.get('avg_tokens_per_second', 0)
+        text_rate = _success_rate(text_stats)
+        writing_rate = _success_rate(writing_stats)
+        image_rate = _success_rate(image_stats)
+        text_tokens = text_stats.get('total_tokens') or {}
+        writing_tokens = writing_stats.get('total_tokens') or {}
+        image_tokens = image_stats.get('total_tokens') or {}
+        total_time = text_stats.get('total_time_seconds', 0) + writing_stats.get('total_time_seconds', 0) + image_stats.get('total_time_seconds', 0)
+        total_tokens = text_tokens.get('total_tokens', 0) + writing_tokens.get('total_tokens', 0) + image_tokens.get('total_tokens', 0)
+        total_prompt = text_tokens.get('prompt_tokens', 0) + writing_tokens.get('prompt_tokens', 0) + image_tokens.get('prompt_tokens', 0)
+        total_completion = text_tokens.get('completion_tokens', 0) + writing_tokens.get('completion_tokens', 0) + image_tokens.get('completion_tokens', 0)
+        avg_output = (text_stats.get('avg_output_tokens_per_case', 0) + writing_stats.get('avg_output_tokens_per_case', 0) + image_stats.get('avg_output_tokens_per_case', 0)) / 3
+        total_retries = text_stats.get('retry_count', 0) + writing_stats.get('retry_count', 0) + image_stats.get('retry_count', 0)
+
+        # 计算平均值：只统计速度大于 0 的类型，边遍历边累加
+        speed_sum = 0.0
+        speed_count = 0
+        for speed in (text_speed, writing_speed, image_speed):
+            if speed > 0:
+                speed_sum += speed
+                speed_count += 1
+        overall_avg_speed = speed_sum / speed_count if speed_count else 0
+        speed_max = overall_avg_speed if overall_avg_speed > 0 else 100
+
+        return _STATS_TMPL.format_map({
+            "text_speed": text_speed,
+            "writing_speed": writing_speed,
+            "image_speed": image_speed,
+            "text_time": text_stats.get('avg_time_per_case', 0),
+            "writing_time": writing_stats.get('avg_time_per_case', 0),
+            "image_time": image_stats.get('avg_time_per_case', 0),
+            "text_rate": text_rate,
+            "writing_rate": writing_rate,
+            "image_rate": image_rate,
+            "overall_avg_speed": overall_avg_speed,
+            "total_time": total_time,
+            "total_tokens": total_tokens,
+            "total_prompt": total_prompt,
+            "total_completion": total_completion,
+            "avg_output": avg_output,
+            "total_retries": total_retries,
+            "speed_bars": _bars([
+                ('代码生成', text_speed, speed_max, '#667eea'),
+                ('文生文', writing_speed, speed_max, '#f5576c'),
+                ('文生图', image_speed, speed_max, '#00f2fe'),
+            ]),
+            "rate_bars": _bars([
+                ('代码生成', text_rate, 100, '#10b981'),
+                ('文生文', writing_rate, 100, '#10b981'),
+                ('文生图', image_rate, 100, '#10b981'),
+            ]),
+        })
+
+    def generate_bar(self, label, value, max_value, color):
+        """生成单个条形图"""
+        return _bars([(label, value, max_value, color)])
+
+    def generate_text_cards(self, results):
+        """生成代码生成卡片（带图标）"""
+        return self._render_cards("text", results)
+
+    def generate_writing_cards(self, results):
+        """生成文生文卡片（优化版 - 更美观完整）"""
+        return self._render_cards("writing", results)
 
     def generate_image_cards(self, results):
         """生成文生图卡片"""
-        cards = []
-        for r in results:
-            difficulty = r.get('difficulty', '中')
-            category = r.get('category', '未分类')
-            tags = r.get('tags', [])
-
-            if r.get("image_file"):
-                img_html = f'<img src="{r["image_file"]}" alt="{r.get("name", "")}" class="gallery-img" onclick="openLightbox(\'{r["image_file"]}\')">'
-            else:
-                icon = r.get('icon', '🖼️')
-                img_html = f'<div class="icon-bg"><div class="icon-emoji">{icon}</div></div>'
-
-            card = f'''
-            <div class="gallery-item" data-name="{r.get('name', '')}" data-id="{r.get('id', '')}" data-tags="{' '.join(tags)}" data-difficulty="{difficulty}">
-                {img_html}
-                <div class="item-overlay">
-                    <span class="item-category">{category}</span>
-                    <div class="item-title">{r.get('name', '未命名')}</div>
-                </div>
-            </div>
-            '''
-            cards.append(card)
-        return "".join(cards)
+        return self._render_cards("image", results)
+
+    def _render_cards(self, kind, results):
+        """渲染一组同类卡片"""
+        return "".join(map(self._card_renderer(kind), results))
+
+    def _card_renderer(self, kind):
+        """返回渲染单张 kind 类卡片的函数：三类卡片只有模板和专属字段不同，填充流程共用"""
+        fill = _CARD_TEMPLATES[kind].format_map
+        fields = getattr(self, f"_{kind}_card_fields")
+        return lambda r: fill(fields(r))
+
+    @staticmethod
+    def _common_card_fields(r, tags):
+        """三类卡片共有的模板字段（均已转义），tags 为转义后的标签列表"""
+        return {
+            "difficulty": _escape(r.get('difficulty', '中')),
+            "category_html": _escape(r.get('category', '未分类')),
+            "tags_joined": ' '.join(tags),
+            "name_html": _escape(r.get('name', '')),
+            "rid_html": _escape(r.get('id', '')),
+            # 旧结构的记录（未经 _simplify_result）没有预先拼好的搜索串，现拼一份
+            "search": _escape(r['search'] if 'search' in r else _search_text(r)),
+        }
+
+    def get_category_bg_class(self, category):
+        """根据分类返回背景样式类"""
+        return _CATEGORY_BG_CLASS.get(category, '')
+
+    def _text_card_fields(self, r):
+        """代码生成卡片的模板字段（均已转义）"""
+        tags = [_escape(tag) for tag in r.get('tags', [])]
+        fields = self._common_card_fields(r, tags)
+        html_file = r.get("html_file")
+        html_btn = ""
+        if html_file:
+            html_btn = f'<a href="{_escape(html_file)}" target="_blank" class="btn btn-primary">查看演示</a>'
+        fields.update(
+            icon=_escape(r.get('icon', '📄')),
+            # 根据分类选择背景样式
+            bg_class=self.get_category_bg_class(r.get('category', '未分类')),
+            tags_html="".join(map(_TAG_SPAN, tags[:3])),
+            # 旧结构的记录没有预先截好的短预览，从完整提示词现截
+            prompt_html=_escape(r['prompt_short'] if 'prompt_short' in r else (r.get('prompt') or '')[:100]),
+            # 没有截断标记的旧数据按截断处理，保持原来的显示
+            ellipsis="..." if r.get('prompt_truncated', True) else "",
+            html_btn=html_btn,
+        )
+        return fields
+
+    def _writing_card_fields(self, r):
+        """文生文卡片的模板字段（均已转义）"""
+        tags = [_escape(tag) for tag in r.get('tags', [])]
+        fields = self._common_card_fields(r, tags)
+        # 响应与提示词只取一次，长度也只算一次
+        prompt = r.get('prompt') or ''
+        response = r.get('response') or ''
+        response_len = len(response)
+
+        # 获取响应内容预览（更长的预览）
+        response_preview_html = response[:350].translate(_HTML_ESCAPE_INLINE_TABLE)
+        if response_len > 350:
+            response_preview_html += '...'
+
+        # 提示词预览
+        prompt_preview = _escape(prompt[:120])
+        if len(prompt) > 120:
+            prompt_preview += '...'
+
+        fields.update(
+            icon=_escape(r.get('icon', '📝')),
+            # 根据分类选择背景样式
+            bg_class=self.get_category_bg_class(r.get('category', '未分类')),
+            tags_html="".join(map(_TAG_SPAN, tags[:4])),
+            tag_count=len(tags),
+            # 字数统计
+            char_count=r.get('char_count', response_len),
+            prompt_preview=prompt_preview,
+            response_preview_html=response_preview_html,
+        )
+        return fields
+
+    def generate_writing_data(self, results):
+        """生成文生文模态框的数据表（JSON），卡片只带 id，点击时按 id 查表"""
+        table = {
+            r.get('id', ''): {
+                "name": r.get('name', ''),
+                "prompt": (r.get('prompt') or '')[:200].replace('\n', ' '),
+                # 原文直接放入，页面用 textContent 显示，不再在 Python 里做 HTML 转义
+                "content": r.get('response') or '',
+            }
+            for r in results
+        }
+        return _script_json(table)
+
+    def _image_card_fields(self, r):
+        """文生图卡片的模板字段（均已转义）"""
+        fields = self._common_card_fields(r, [_escape(tag) for tag in r.get('tags', [])])
+        image_file = r.get("image_file")
+        if image_file:
+            image_file = _escape(image_file)
+            fields["img_html"] = f'<img src="{image_file}" alt="{fields["name_html"]}" class="gallery-img" loading="lazy" decoding="async" data-lightbox-src="{image_file}">'
+        else:
+            icon = _escape(r.get('icon', '🖼️'))
+            fields["img_html"] = f'<div class="icon-bg"><div class="icon-emoji">{icon}</div></div>'
+        return fields
 
 
 # 保持向后兼容